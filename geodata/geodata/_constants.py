@@ -0,0 +1,8 @@
+"""Provides numerical constants shared by the point and route datatypes.
+"""
+import math
+
+# conversion factors between degrees and radians, computed once at import. Multiplying by them yields the same result
+# as math.radians and math.degrees, which use the same factors.
+DEG2RAD = math.pi / 180.0
+RAD2DEG = 180.0 / math.pi
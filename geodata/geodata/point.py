@@ -6,6 +6,63 @@ import warnings
 import numpy as np
 import haversine as hs
 
+# valid values of a point's geo_reference_system and coordinates_unit
+_VALID_CRS = frozenset(("cartesian", "latlon"))
+_VALID_UNITS = frozenset(("radians", "degrees"))
+
+# valid types of a point's coordinates
+_COORDINATE_TYPES = (int, float, np.float64)
+
+# earth radius in meters used when adding vectors onto points
+_EARTH_RADIUS = 6_371_000
+
+
+def _bearing(lon1, lat1, lon2, lat2):
+    """
+    Calculates the initial bearing in radian between two coordinate pairs given as floats in radians.
+    """
+    return math.atan2(math.sin(lon2 - lon1) * math.cos(lat2),
+                      math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1))
+
+
+def _destination(lon, lat, angular_distance, angle):
+    """
+    Calculates the coordinates reached from a coordinate pair given as floats in radians when travelling the
+    angular_distance in direction of angle (both in radian).
+
+    Returns
+    -------
+    longitude, latitude : float
+        The coordinates of the destination in radians.
+    """
+    latitude = math.asin(
+        math.sin(lat) * math.cos(angular_distance)
+        + math.cos(lat) * math.sin(angular_distance) * math.cos(angle)
+    )
+    longitude = lon + math.atan2(
+        math.sin(angle) * math.sin(angular_distance) * math.cos(lat),
+        math.cos(angular_distance) - math.sin(lat) * math.sin(latitude),
+    )
+    # normalize to [-180,180]
+    longitude = (longitude + 3 * math.pi) % (2 * math.pi) - math.pi
+    return longitude, latitude
+
+
+def _interpolate(lon1, lat1, lon2, lat2, ratio):
+    """
+    Interpolates between two coordinate pairs given as floats in radians on plain floats, without creating
+    intermediate Point objects. Uses the same distance, bearing and destination calculations as get_distance,
+    get_bearing and Point.add_vector_.
+
+    Returns
+    -------
+    longitude, latitude : float
+        The coordinates of the interpolated point in radians.
+    """
+    distance = hs.haversine([math.degrees(lat1), math.degrees(lon1)], [math.degrees(lat2), math.degrees(lon2)],
+                            hs.Unit.METERS)
+    return _destination(lon1, lat1, ratio * distance / _EARTH_RADIUS, _bearing(lon1, lat1, lon2, lat2))
+
 
 def get_bearing(point_a, point_b):
     """
@@ -32,9 +89,7 @@ def get_bearing(point_a, point_b):
     point_b = point_b.to_radians(ignore_warnings=True)
     lon1, lat1 = point_a
     lon2, lat2 = point_b
-    bearing = math.atan2(math.sin(lon2 - lon1) * math.cos(lat2),
-                         math.cos(lat1) * math.sin(lat2) - math.sin(lat1) * math.cos(lat2) * math.cos(lon2 - lon1))
-    return bearing
+    return _bearing(lon1, lat1, lon2, lat2)
 
 
 def get_distance(point_a, point_b):
@@ -90,13 +145,20 @@ def get_interpolated_point(start_point, end_point, ratio):
     """
     geo_ref = start_point.get_geo_reference_system()
     if geo_ref == 'latlon':
-        coordinates_unit = start_point.get_coordinates_unit()
+        if end_point.get_geo_reference_system() != 'latlon':
+            raise ValueError("Both points need to be in 'latlon' format.")
+        if end_point.get_coordinates_unit() != 'radians':
+            warnings.warn('Coordinates do not have the same unit and will be converted before calculation.')
         # calculate interpolation with radians unit coordinates
-        start_point = start_point.to_radians(ignore_warnings=True)
-        interpolated_point = Point(start_point, geo_reference_system=geo_ref)
-        interpolated_point.add_vector_(ratio * get_distance(start_point, end_point), get_bearing(start_point, end_point))
+        lon1, lat1 = start_point.x_lon, start_point.y_lat
+        if start_point.get_coordinates_unit() == 'degrees':
+            lon1, lat1 = math.radians(lon1), math.radians(lat1)
+        lon2, lat2 = end_point.x_lon, end_point.y_lat
+        if end_point.get_coordinates_unit() == 'degrees':
+            lon2, lat2 = math.radians(lon2), math.radians(lat2)
+        interpolated_point = Point(list(_interpolate(lon1, lat1, lon2, lat2, ratio)), geo_reference_system=geo_ref)
         # convert back to 'degrees' only if start point's coordinates unit was 'degrees'
-        if coordinates_unit == 'degrees':
+        if start_point.get_coordinates_unit() == 'degrees':
             interpolated_point.to_degrees_()
     else:
         raise NotImplementedError("Interpolating in the cartesian plane is not available.")
@@ -107,6 +169,12 @@ class Point(list):
     """A point specifying a geographical location.
     """
 
+    # points are created in large numbers by routes, so their attributes are stored in slots instead of a __dict__
+    __slots__ = ('x_lon', 'y_lat', '__geo_reference_system', '__coordinates_unit', '__earth_radius', '_frozen')
+    # the (name mangled) attributes that deep_copy() copies
+    _copied_attributes = ('x_lon', 'y_lat', '_Point__geo_reference_system', '_Point__coordinates_unit',
+                          '_Point__earth_radius')
+
     def __init__(self, coordinates, geo_reference_system="latlon", coordinates_unit="radians"):
         """
         Creates a new Point object.
@@ -124,11 +192,13 @@ class Point(list):
             The coordinates unit of this point.
         """
         super().__init__(coordinates)
+        # frozen points cannot be modified, see freeze()
+        self._frozen = False
         self.__geo_reference_system = None
         self.set_geo_reference_system(geo_reference_system)
         self.__coordinates_unit = None
         self.set_coordinates_unit(coordinates_unit)
-        self.__earth_radius = 6_371_000
+        self.__earth_radius = _EARTH_RADIUS
         self.x_lon = coordinates[0]
         self.y_lat = coordinates[1]
         if not self.is_coordinates_unit_valid():
@@ -137,9 +207,25 @@ class Point(list):
         if not (isinstance(coordinates, list) and len(coordinates) == 2):
             raise ValueError("Coordinates need to be a list with two elements.")
         for i in range(2):
-            if type(coordinates[i]) not in (int, float, np.float64):
+            if type(coordinates[i]) not in _COORDINATE_TYPES:
                 raise ValueError("Coordinates need to be of type int or float.")
 
+    @classmethod
+    def _create_unchecked(cls, coordinates, geo_reference_system, coordinates_unit):
+        """
+        Creates a new point like __init__ does, but without validating the arguments. Only to be used with arguments
+        that have already been validated, e.g. in bulk when creating a Route.
+        """
+        point = cls.__new__(cls)
+        list.extend(point, coordinates)
+        point._frozen = False
+        point.__geo_reference_system = geo_reference_system
+        point.__coordinates_unit = coordinates_unit
+        point.__earth_radius = _EARTH_RADIUS
+        point.x_lon = coordinates[0]
+        point.y_lat = coordinates[1]
+        return point
+
     def append(self, obj):
         warnings.warn("Point class does not provide append functionality. Use set instead.")
 
@@ -160,6 +246,7 @@ class Point(list):
         point
             The modified point instance.
         """
+        self._check_not_frozen()
         super().__setitem__(key, value)
         if key == 0:
             self.x_lon = value
@@ -167,6 +254,64 @@ class Point(list):
             self.y_lat = value
         return self
 
+    def _update_coordinates(self):
+        # keeps x_lon and y_lat in line with the list items after the list has been modified as a whole
+        if len(self) >= 2:
+            self.x_lon = self[0]
+            self.y_lat = self[1]
+
+    def __delitem__(self, key):
+        self._check_not_frozen()
+        super().__delitem__(key)
+        self._update_coordinates()
+
+    def __iadd__(self, other):
+        self._check_not_frozen()
+        super().__iadd__(other)
+        self._update_coordinates()
+        return self
+
+    def __imul__(self, other):
+        self._check_not_frozen()
+        super().__imul__(other)
+        self._update_coordinates()
+        return self
+
+    def insert(self, index, obj):
+        self._check_not_frozen()
+        super().insert(index, obj)
+        self._update_coordinates()
+
+    def extend(self, iterable):
+        self._check_not_frozen()
+        super().extend(iterable)
+        self._update_coordinates()
+
+    def pop(self, index=-1):
+        self._check_not_frozen()
+        value = super().pop(index)
+        self._update_coordinates()
+        return value
+
+    def remove(self, value):
+        self._check_not_frozen()
+        super().remove(value)
+        self._update_coordinates()
+
+    def clear(self):
+        self._check_not_frozen()
+        super().clear()
+
+    def reverse(self):
+        self._check_not_frozen()
+        super().reverse()
+        self._update_coordinates()
+
+    def sort(self, *args, **kwargs):
+        self._check_not_frozen()
+        super().sort(*args, **kwargs)
+        self._update_coordinates()
+
     def set_x_lon(self, value):
         """
         Sets the x coordinate or longitude of this point.
@@ -200,8 +345,9 @@ class Point(list):
             - 'latlon': latitude and longitude coordinates on earth
             - 'cartesian': uses Euclidean space
         """
-        if value not in ("cartesian", "latlon"):
+        if not isinstance(value, str) or value not in _VALID_CRS:
             raise ValueError("Geo reference system can only be 'latlon' or 'cartesian'.")
+        self._check_not_frozen()
         self.__geo_reference_system = value
 
     def get_geo_reference_system(self):
@@ -304,8 +450,9 @@ class Point(list):
         value : {'radians', 'degrees'}
             The unit of this point's coordinates if their geo reference system is 'latlon'.
         """
-        if value not in ("radians", "degrees"):
+        if not isinstance(value, str) or value not in _VALID_UNITS:
             raise ValueError("Coordinates unit can only be 'radians' or 'degrees'.")
+        self._check_not_frozen()
         self.__coordinates_unit = value
 
     def get_coordinates_unit(self):
@@ -333,17 +480,7 @@ class Point(list):
             Angle of vector in radian.
         """
         if self.get_geo_reference_system() == "latlon":
-            angular_distance = distance / self.__earth_radius
-            latitude_tmp = math.asin(
-                math.sin(self.y_lat) * math.cos(angular_distance)
-                + math.cos(self.y_lat) * math.sin(angular_distance) * math.cos(angle)
-            )
-            longitude_tmp = self.x_lon + math.atan2(
-                math.sin(angle) * math.sin(angular_distance) * math.cos(self.y_lat),
-                math.cos(angular_distance) - math.sin(self.y_lat) * math.sin(latitude_tmp),
-            )
-            # normalize to [-180,180]
-            longitude_tmp = (longitude_tmp + 3 * math.pi) % (2 * math.pi) - math.pi
+            longitude_tmp, latitude_tmp = _destination(self.x_lon, self.y_lat, distance / self.__earth_radius, angle)
             self.set_x_lon(longitude_tmp)
             self.set_y_lat(latitude_tmp)
         else:
@@ -456,13 +593,62 @@ class Point(list):
         Point
             A deep copy of this point.
         """
-        return Point(self, geo_reference_system=self.__geo_reference_system, coordinates_unit=self.__coordinates_unit)
+        # bypass __init__ and its validation, since this point has already been validated
+        point_copy = self.__class__.__new__(self.__class__)
+        list.extend(point_copy, self)
+        # all attributes hold immutable values, so copying the slot values suffices
+        for name in self._copied_attributes:
+            setattr(point_copy, name, getattr(self, name))
+        # a copy of a frozen point can be modified
+        point_copy._frozen = False
+        return point_copy
+
+    def __deepcopy__(self, memo):
+        return self.deep_copy()
+
+    def __getstate__(self):
+        # pickle protocols 0 and 1 do not pickle slots, so the attributes are provided as a dict for all protocols
+        state = {name: getattr(self, name) for name in self._copied_attributes}
+        state['_frozen'] = self._frozen
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def freeze(self):
+        """
+        Makes this point immutable, so that it can be shared without being copied. Any attempt to modify a frozen
+        point raises a TypeError, while its copies, e.g. created by deep_copy() or to_radians(), can be modified.
+
+        Returns
+        -------
+        Point
+            This point instance, which is now frozen.
+        """
+        self._frozen = True
+        return self
+
+    def is_frozen(self):
+        """
+        Returns True, if this point is frozen and cannot be modified.
+
+        Returns
+        -------
+        bool
+            True, if this point is frozen, else False.
+        """
+        return self._frozen
+
+    def _check_not_frozen(self):
+        # points that are being unpickled get their items before their attributes, so _frozen may not be set yet
+        if getattr(self, '_frozen', False):
+            raise TypeError("Point is frozen and cannot be modified. Use deep_copy() to get a modifiable copy.")
 
     def is_coordinates_unit_valid(self):
-        return self.get_geo_reference_system() == 'cartesian' or \
-               (
-                       (self.get_coordinates_unit() == 'degrees' and -180 <= self.x_lon <= 180 and
-                        -90 <= self.y_lat <= 90) or
-                       (self.get_coordinates_unit() == 'radians' and -np.pi <= self.x_lon <= np.pi and
-                        -np.pi <= self.y_lat <= np.pi)
-               )
+        if self.get_geo_reference_system() == 'cartesian':
+            return True
+        # scalar comparisons with math.pi, as this check runs for every single created point
+        if self.get_coordinates_unit() == 'degrees':
+            return -180 <= self.x_lon <= 180 and -90 <= self.y_lat <= 90
+        return -math.pi <= self.x_lon <= math.pi and -math.pi <= self.y_lat <= math.pi
@@ -1,5 +1,6 @@
 """Provides a point datatype for geo-coordinates and timestamps and their manipulation.
 """
+import numpy as np
 import pandas
 
 from geodata.geodata.point import Point, get_interpolated_point as get_interpolated
@@ -35,6 +36,9 @@ class PointT(Point):
     """A point specifying a geographical location and a timestamp.
     """
 
+    __slots__ = ('_timestamp_ns', '_timestamp_tz')
+    _copied_attributes = Point._copied_attributes + __slots__
+
     def __init__(self, coordinates, timestamp, geo_reference_system="latlon", coordinates_unit='radians'):
         """
         Creates a new PointT object.
@@ -54,19 +58,46 @@ class PointT(Point):
             The coordinates unit of this point.
         """
         super().__init__(coordinates, geo_reference_system, coordinates_unit)
-        if isinstance(timestamp, pandas.Timestamp):
-            self.timestamp = timestamp
-        else:
-            raise TypeError("Timestamp needs to be of type pandas.Timestamp.")
+        self._timestamp_ns = None
+        self._timestamp_tz = None
+        self.timestamp = timestamp
 
-    def deep_copy(self):
+    @classmethod
+    def _create_unchecked(cls, coordinates, geo_reference_system, coordinates_unit, timestamp_ns=0):
         """
-        Creates a deep copy of this point preserving its properties.
+        Creates a new point like __init__ does, but without validating the arguments. The timestamp is given as
+        nanoseconds since epoch and is timezone naive.
+        """
+        point = super()._create_unchecked(coordinates, geo_reference_system, coordinates_unit)
+        point._timestamp_ns = np.int64(timestamp_ns)
+        point._timestamp_tz = None
+        return point
+
+    @property
+    def timestamp(self):
+        """
+        The timestamp assigned to this point. It is stored as nanoseconds since epoch and only converted into a
+        pandas.Timestamp when read.
 
         Returns
         -------
-        Point
-            A deep copy of this point.
+        pandas.Timestamp
+            The timestamp assigned to this point.
         """
-        return PointT(self, timestamp=self.timestamp, geo_reference_system=self.get_geo_reference_system(),
-                      coordinates_unit=self.get_coordinates_unit())
+        return pandas.Timestamp(self._timestamp_ns, tz=self._timestamp_tz)
+
+    @timestamp.setter
+    def timestamp(self, value):
+        """
+        Sets the timestamp assigned to this point.
+
+        Parameters
+        ----------
+        value : pandas.Timestamp
+            The new timestamp of this point.
+        """
+        self._check_not_frozen()
+        if not isinstance(value, pandas.Timestamp):
+            raise TypeError("Timestamp needs to be of type pandas.Timestamp.")
+        self._timestamp_ns = np.int64(value.value)
+        self._timestamp_tz = value.tz
@@ -1,12 +1,85 @@
 """Provides a route datatype for lists of points (geo-coordinates) and their manipulation.
 """
+import itertools
+import math
 import warnings
 
-import torch
+import haversine as hs
 import numpy as np
-from geodata.geodata.point import Point, get_distance
+from geodata.geodata._constants import DEG2RAD, RAD2DEG
+from geodata.geodata.point import Point, _COORDINATE_TYPES, _EARTH_RADIUS, _VALID_CRS, _VALID_UNITS
 from geodata.geodata.point_t import PointT
 
+# defaults of an empty route, matching the defaults of Point
+_DEFAULT_GEO_REFERENCE_SYSTEM = 'latlon'
+_DEFAULT_COORDINATES_UNIT = 'radians'
+# earth radius in kilometers used by the cartesian projection
+_EARTH_RADIUS_KM = _EARTH_RADIUS / 1000
+
+
+def _latlon_to_cartesian_(coordinates):
+    """
+    Projects an array of shape (N, 2) holding longitude and latitude in radians instantly into cartesian coordinates,
+    using the same projection as Point.to_cartesian_().
+    """
+    coordinates[:, 0] *= _EARTH_RADIUS_KM
+    coordinates[:, 1] = _EARTH_RADIUS_KM * np.log(np.tan(np.pi / 4.0 + coordinates[:, 1] / 2.0))
+
+
+def _cartesian_to_latlon_(coordinates):
+    """
+    Projects an array of shape (N, 2) holding cartesian coordinates instantly into longitude and latitude in radians,
+    using the same projection as Point.to_latlon_().
+    """
+    coordinates[:, 0] /= _EARTH_RADIUS_KM
+    coordinates[:, 1] = np.pi / 2 - 2 * np.arctan(np.exp(-coordinates[:, 1] / _EARTH_RADIUS_KM))
+
+
+def _get_consecutive_distances(coordinates, geo_reference_system, coordinates_unit):
+    """
+    Calculates the distances in meters between consecutive rows of an array of shape (N, 2) in a single vectorized
+    pass, using the same formulas as get_distance() for each pair of points.
+    """
+    if geo_reference_system == 'latlon':
+        if coordinates_unit == 'radians':
+            coordinates = coordinates * RAD2DEG
+        # haversine expects the coordinates in the order latitude, longitude
+        lat_lon = coordinates[:, ::-1]
+        return hs.haversine_vector(lat_lon[:-1], lat_lon[1:], hs.Unit.METERS)
+    deltas = np.diff(coordinates, axis=0)
+    return np.sqrt(np.einsum('ij,ij->i', deltas, deltas))
+
+
+def _get_max_consecutive_distance(coordinates, geo_reference_system, coordinates_unit):
+    """
+    Calculates the maximum distance in meters between consecutive rows of an array of shape (N, 2), with N > 1. For
+    cartesian coordinates, the squared distances are compared and the square root is only taken of their maximum.
+    """
+    if geo_reference_system == 'cartesian':
+        deltas = np.diff(coordinates, axis=0)
+        return math.sqrt(np.einsum('ij,ij->i', deltas, deltas).max())
+    return float(_get_consecutive_distances(coordinates, geo_reference_system, coordinates_unit).max())
+
+
+def _set_points_(points, coordinates, geo_reference_system, coordinates_unit):
+    """
+    Overwrites the coordinates, geo reference system and coordinates unit of the given points instantly in a single
+    pass, where coordinates is an array of shape (len(points), 2).
+    """
+    for point, (x_lon, y_lat) in zip(points, coordinates.tolist()):
+        point.set_x_lon(x_lon)
+        point.set_y_lat(y_lat)
+        point.set_geo_reference_system(geo_reference_system)
+        point.set_coordinates_unit(coordinates_unit)
+
+
+def _is_coordinates_list(route):
+    """
+    Returns True, if all items of route are lists of two coordinates of a valid type, but not of type Point.
+    """
+    return all(type(point) is list and len(point) == 2 and type(point[0]) in _COORDINATE_TYPES and
+               type(point[1]) in _COORDINATE_TYPES for point in route)
+
 
 class Route(list):
     """A route indicating a sequence of points. If timestamps are given for each point, the route is sorted by time.
@@ -21,53 +94,50 @@ class Route(list):
         bool
             True, if route is not empty and points have timestamps, else False.
         """
-        has_timestamps = False
-        if len(self) > 0:
-            has_timestamps = True
-            for point in self:
-                if not isinstance(point, PointT):
-                    has_timestamps = False
-        return has_timestamps
+        return len(self) > 0 and all(isinstance(point, PointT) for point in self)
 
     def get_coordinates_unit(self):
         """
-        Returns the coordinates_unit of the points of this route. If the units are not the same for all points, raises
-        an exception.
+        Returns the coordinates_unit of the points of this route. If the units or the geo reference systems are not the
+        same for all points, raises an exception.
 
         Returns
         -------
         this_routes_coordinates_unit : {'radians', 'degrees'}
             The coordinates unit of the points of this route.
         """
-        default_coordinates_unit = Point([0, 0]).get_coordinates_unit()
-        this_routes_coordinates_unit = default_coordinates_unit
-        if len(self) > 0:
-            coordinates_unit = self[0].get_coordinates_unit()
-            for point in self:
-                if point.get_coordinates_unit() != coordinates_unit:
-                    raise Exception("Not all points of route have the same coordinates unit.")
-            this_routes_coordinates_unit = coordinates_unit
-        return this_routes_coordinates_unit
+        return self._get_format()[1]
 
     def get_geo_reference_system(self):
         """
-        Returns the geo_reference_system of the points of this route. If the geo_reference_system is not the same for
-        all points, raises an exception.
+        Returns the geo_reference_system of the points of this route. If the geo_reference_system or the coordinates
+        unit is not the same for all points, raises an exception.
 
         Returns
         -------
         this_routes_geo_reference_system : {'latlon', 'cartesian'}
             The geo_reference_system of the points of this route.
         """
-        default_geo_reference_system = Point([0, 0]).get_geo_reference_system()
-        this_routes_geo_reference_system = default_geo_reference_system
-        if len(self) > 0:
-            geo_reference_system = self[0].get_geo_reference_system()
-            for point in self:
-                if point.get_geo_reference_system() != geo_reference_system:
-                    raise Exception("Not all points of route have the same geo reference system.")
-            this_routes_geo_reference_system = geo_reference_system
-        return this_routes_geo_reference_system
+        return self._get_format()[0]
+
+    def _get_format(self):
+        """
+        Returns the geo reference system and coordinates unit of the points of this route, checking both route-wide
+        invariants in a single pass. If not all points share the same values, raises an exception.
+
+        Returns
+        -------
+        geo_reference_system, coordinates_unit : str, str
+            The geo reference system and coordinates unit of the points of this route.
+        """
+        if len(self) == 0:
+            return _DEFAULT_GEO_REFERENCE_SYSTEM, _DEFAULT_COORDINATES_UNIT
+        formats = {(point.get_geo_reference_system(), point.get_coordinates_unit()) for point in self}
+        if len(formats) > 1:
+            if len({coordinates_unit for _, coordinates_unit in formats}) > 1:
+                raise Exception("Not all points of route have the same coordinates unit.")
+            raise Exception("Not all points of route have the same geo reference system.")
+        return formats.pop()
 
     def __init__(self, route=None, timestamps=None, coordinates_unit=None):
         """
@@ -94,12 +164,23 @@ class Route(list):
                 # make sure timestamps are of same length as route
                 if not len(timestamps) == len(route):
                     raise ValueError("Timestamps and route need to be of same length.")
+            # a unit, that is not a valid string, is rejected by the points created below
+            valid_unit = coordinates_unit is None or \
+                isinstance(coordinates_unit, str) and coordinates_unit in _VALID_UNITS
+            if timestamps is None and len(route) > 0 and _is_coordinates_list(route) and valid_unit:
+                # plain coordinates are validated at once, so that the points do not need to validate themselves
+                coordinates_unit = coordinates_unit or _DEFAULT_COORDINATES_UNIT
+                self._validate_units(np.asarray(route, dtype=np.float64), coordinates_unit)
+                super().__setitem__(slice(None), [
+                    Point._create_unchecked(point, _DEFAULT_GEO_REFERENCE_SYSTEM, coordinates_unit) for point in route])
+                return
             # make sure list items are of type Point
+            points = []
             for idx, point in enumerate(route):
                 if not isinstance(point, Point):
                     # create Point maybe with timestamp and the proper coordinates unit
                     if coordinates_unit is None:
-                        coordinates_unit = Point([0, 0]).get_coordinates_unit()
+                        coordinates_unit = _DEFAULT_COORDINATES_UNIT
                     if timestamps is None:
                         point = Point(point, coordinates_unit=coordinates_unit)
                     else:
@@ -111,10 +192,11 @@ class Route(list):
                                         f"the provided points.")
                     if timestamps is not None:
                         point = PointT(point, timestamps[idx])
-                self.__setitem__(idx, point)
+                points.append(point)
+            # set all points at once, so that the route is validated and sorted once instead of for every point
+            super().__setitem__(slice(None), points)
             # make sure that provided points do have the same coordinates unit and geo reference system
-            self.get_coordinates_unit()
-            self.get_geo_reference_system()
+            self._get_format()
 
             if self.has_timestamps():
                 self.sort_by_time()
@@ -145,19 +227,86 @@ class Route(list):
     @classmethod
     def from_torch_tensor(cls, tensor):
         """
-        Create a Route object from a route in torch.Tensor format.
+        Create a Route object from a route in torch.Tensor format. The tensor's memory is shared with a NumPy array
+        instead of being converted element-wise.
 
         Parameters
         ----------
         tensor : torch.Tensor
-            The tensor object which is to be transformed into a Route object.
+            The tensor object of shape (N, 2) which is to be transformed into a Route object.
 
         Returns
         -------
         Route
             The tensor object transformed into a Route object.
         """
-        return cls(tensor.detach().numpy().tolist())
+        return cls.from_arrays(tensor.detach().cpu().numpy())
+
+    @staticmethod
+    def _validate_units(coordinates, coordinates_unit):
+        """
+        Checks in a single vectorized pass that all 'latlon' coordinates are in the valid value range of
+        coordinates_unit, which is the same range that Point.is_coordinates_unit_valid() checks for a single point.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            An array of shape (N, 2) holding the longitude and latitude of each point.
+        coordinates_unit : {'radians', 'degrees'}
+            The coordinates unit of the coordinates.
+        """
+        x_limit, y_limit = (math.pi, math.pi) if coordinates_unit == 'radians' else (180.0, 90.0)
+        # negated, so that NaN coordinates are rejected as well
+        if not ((np.abs(coordinates[:, 0]) <= x_limit).all() and (np.abs(coordinates[:, 1]) <= y_limit).all()):
+            raise ValueError(f"Coordinates are not in the valid value range for coordinates_unit '"
+                             f"{coordinates_unit}'.")
+
+    @classmethod
+    def from_arrays(cls, coordinates, timestamps=None, geo_reference_system='latlon', coordinates_unit='radians'):
+        """
+        Create a Route object from an array of coordinates and optionally an array of timestamps at once, without
+        appending the points one by one.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            An array of shape (N, 2) holding the x- and y-coordinate of each point.
+        timestamps : np.ndarray, optional
+            An array of shape (N,) holding the timestamp of each point as nanoseconds since epoch. If given, the route
+            consists of points with timestamps and is sorted by time.
+        geo_reference_system : {'latlon', 'cartesian'}
+            Geographical reference system of the coordinates.
+        coordinates_unit : {'radians', 'degrees'}
+            The coordinates unit of the route's points.
+
+        Returns
+        -------
+        Route
+            The route created from coordinates and timestamps.
+        """
+        coordinates = np.asarray(coordinates, dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2:
+            raise ValueError(f"Coordinates need to be of shape (N, 2) but are of shape {coordinates.shape}.")
+        if not isinstance(geo_reference_system, str) or geo_reference_system not in _VALID_CRS:
+            raise ValueError("Geo reference system can only be 'latlon' or 'cartesian'.")
+        if not isinstance(coordinates_unit, str) or coordinates_unit not in _VALID_UNITS:
+            raise ValueError("Coordinates unit can only be 'radians' or 'degrees'.")
+        if geo_reference_system == 'latlon':
+            cls._validate_units(coordinates, coordinates_unit)
+        # all arguments are validated, so that the points do not need to validate themselves
+        route = cls()
+        if timestamps is None:
+            points = [Point._create_unchecked(point, geo_reference_system, coordinates_unit)
+                      for point in coordinates.tolist()]
+        else:
+            timestamps = np.asarray(timestamps, dtype=np.int64)
+            if timestamps.shape != (len(coordinates),):
+                raise ValueError("Timestamps and coordinates need to be of same length.")
+            order = np.argsort(timestamps, kind='stable')
+            points = [PointT._create_unchecked(point, geo_reference_system, coordinates_unit, timestamp)
+                      for point, timestamp in zip(coordinates[order].tolist(), timestamps[order].tolist())]
+        super(Route, route).extend(points)
+        return route
 
     def append(self, value):
         """
@@ -186,20 +335,22 @@ class Route(list):
             if not route_has_timestamps and isinstance(value, PointT):
                 warnings.warn('A point with timestamp was added onto a route without timestamps. The point will be '
                               'appended but the timestamp is removed.')
+            # evaluate the route-wide invariants once instead of for every check
+            route_geo_reference_system, route_coordinates_unit = self._get_format()
             if not isinstance(value, Point):
-                value = Point(value, coordinates_unit=self.get_coordinates_unit())
-            if isinstance(value, Point) and value.get_geo_reference_system() != self.get_geo_reference_system():
+                value = Point(value, coordinates_unit=route_coordinates_unit)
+            if value.get_geo_reference_system() != route_geo_reference_system:
                 raise Exception(f"Point with geo reference system '{value.get_geo_reference_system()}' cannot be "
-                                f"appended to a route with geo reference system '{self.get_geo_reference_system()}'.")
-            if isinstance(value, Point) and value.get_coordinates_unit() != self.get_coordinates_unit():
+                                f"appended to a route with geo reference system '{route_geo_reference_system}'.")
+            if value.get_coordinates_unit() != route_coordinates_unit:
                 warnings.warn(f'Point had differing coordinates_unit than the route it was to be appended to. The '
-                              f"point was converted to '{self.get_coordinates_unit()}' before appending.")
-                if self.get_coordinates_unit() == 'degrees':
+                              f"point was converted to '{route_coordinates_unit}' before appending.")
+                if route_coordinates_unit == 'degrees':
                     value = value.to_degrees()
                 else:
                     value = value.to_radians()
         super().append(value)
-        if self.has_timestamps():
+        if route_has_timestamps:
             self.sort_by_time()
         return self
 
@@ -218,12 +369,41 @@ class Route(list):
         Route
             This route scaled by scale_values.
         """
-        x_min, x_max, y_min, y_max = scale_values
-        for point in self:
-            point.set_x_lon((point.x_lon - x_min) / (x_max - x_min))
-            point.set_y_lat((point.y_lat - y_min) / (y_max - y_min))
+        if len(self) > 0:
+            scaler = self.make_scaler(scale_values)
+            self._set_coordinates_(scaler(self._get_coordinates_array()))
         return self
 
+    @staticmethod
+    def make_scaler(scale_values):
+        """
+        Creates a function that scales coordinates from minimum and maximum values indicated by scale_values parameter
+        to [0,1] like scale() does, but operates on an array of coordinates. The offset and extent of scale_values are
+        calculated once, so that the function can be applied to many arrays with the same scale values.
+
+        Parameters
+        ----------
+        scale_values : tuple
+            Minimum and maximum values to scale coordinates with, provided in format
+            (x minimum, x maximum, y minimum, y maximum) for coordinates x and y.
+
+        Returns
+        -------
+        scaler : Callable[[np.ndarray], np.ndarray]
+            A function that scales an array of shape (N, 2) and dtype float64 instantly and returns it.
+        """
+        x_min, x_max, y_min, y_max = scale_values
+        offset = np.array([x_min, y_min], dtype=np.float64)
+        extent = np.array([x_max - x_min, y_max - y_min], dtype=np.float64)
+        if not extent.all():
+            raise ZeroDivisionError("Minimum and maximum scale values need to differ.")
+
+        def scaler(coordinates):
+            np.subtract(coordinates, offset, out=coordinates)
+            return np.divide(coordinates, extent, out=coordinates)
+
+        return scaler
+
     def inverse_scale(self, scale_values):
         """
         Scales route coordinates from [0,1] to minimum and maximum values indicated by scale_values parameter.
@@ -240,9 +420,11 @@ class Route(list):
             This route scaled to scale_values.
         """
         (x_min, x_max, y_min, y_max) = scale_values
-        for point in self:
-            point.set_x_lon(point.x_lon * (x_max - x_min) + x_min)
-            point.set_y_lat(point.y_lat * (y_max - y_min) + y_min)
+        if len(self) > 0:
+            coordinates = self._get_coordinates_array()
+            np.multiply(coordinates, [x_max - x_min, y_max - y_min], out=coordinates)
+            np.add(coordinates, [x_min, y_min], out=coordinates)
+            self._set_coordinates_(coordinates)
         return self
 
     def pad(self, target_len):
@@ -266,10 +448,11 @@ class Route(list):
                                 "allowed.")
         pad_len = target_len - len(self)
         if pad_len > 0:
-            tensor = torch.tensor(self)
-            pad = torch.nn.ZeroPad2d((0, 0, 0, pad_len))
-            tensor = pad(tensor)
-            self.__init__(tensor.numpy().tolist())
+            # extend by zero points directly instead of re-creating all points of this route
+            geo_reference_system, coordinates_unit = self._get_format()
+            # the zero point is validated once and then copied, which is cheaper than constructing every point
+            zero_point = Point([0., 0.], geo_reference_system, coordinates_unit)
+            super().extend([zero_point] + [zero_point.deep_copy() for _ in range(pad_len - 1)])
         return self
 
     def sort_by_time(self):
@@ -285,7 +468,18 @@ class Route(list):
         if len(self) > 0:
             if not isinstance(self[0], PointT):
                 raise Exception("sort_by_time only applies to routes with items of type PointT.")
-        self.sort(key=lambda item: item.timestamp)
+        if len(self) > 1:
+            # like pandas.Timestamp comparisons, reject mixing tz-naive and tz-aware timestamps, whose nanoseconds since
+            # epoch are not comparable. Timestamps of different timezones are comparable, as they are stored in UTC.
+            timestamps_naive = {point._timestamp_tz is None for point in self}
+            if len(timestamps_naive) > 1:
+                raise TypeError("Cannot compare tz-naive and tz-aware timestamps.")
+            # sort the timestamps as nanoseconds since epoch instead of comparing pandas.Timestamp objects
+            timestamps = self._get_timestamps_array()
+            # routes are mostly appended in chronological order, in which case the points are kept as they are
+            if not np.all(timestamps[1:] >= timestamps[:-1]):
+                order = np.argsort(timestamps, kind='stable')
+                super().__setitem__(slice(None), [self[idx] for idx in order.tolist()])
         return self
 
     def deep_copy(self):
@@ -298,10 +492,14 @@ class Route(list):
             A deep copy of this route.
         """
         route_copy = Route()
-        for point in self:
-            route_copy.append(point.deep_copy())
+        # the points of this route are already validated and sorted, so they are copied without appending. PointT
+        # inherits deep_copy from Point, so the unbound method is mapped over all points without per-point lookups.
+        super(Route, route_copy).extend(map(Point.deep_copy, self))
         return route_copy
 
+    def __deepcopy__(self, memo):
+        return self.deep_copy()
+
     def get_timestamps(self):
         """
         Returns the timestamps of the route points as a list, if the route has timestamps.
@@ -313,9 +511,7 @@ class Route(list):
         """
         timestamps = None
         if self.has_timestamps():
-            timestamps = []
-            for point in self:
-                timestamps.append(point.timestamp)
+            timestamps = [point.timestamp for point in self]
         return timestamps
 
     def delete_point_at_(self, idx):
@@ -332,10 +528,10 @@ class Route(list):
         Route
             This route without item at position idx.
         """
-        if len(self) > 0 and len(self) > idx:
-            self.__delitem__(idx)
-        else:
-            raise KeyError("idx is not valid. The route contains" + str(len(self)) + "points.")
+        # a single bounds check, which also rejects negative indices that would otherwise raise an IndexError
+        if not -len(self) <= idx < len(self):
+            raise KeyError(f"idx is not valid. The route contains {len(self)} points.")
+        super().__delitem__(idx)
         return self
 
     def to_cartesian(self, ignore_warnings=False):
@@ -353,6 +549,9 @@ class Route(list):
         route_cartesian : Route
             A copy of this route with each point in a cartesian geo reference system.
         """
+        if len(self) > 0 and self.get_geo_reference_system() == 'latlon':
+            # copy and convert the points in a single pass
+            return self.convert(geo_reference_system='cartesian')
         route_copy = self.deep_copy()
         route_copy.to_cartesian_(ignore_warnings)
         return route_copy
@@ -366,8 +565,16 @@ class Route(list):
         ignore_warnings : bool
             If True, no warning is thrown, when the geo reference system is already 'cartesian'.
         """
-        for point in self:
-            point.to_cartesian_(ignore_warnings)
+        if len(self) == 0:
+            return
+        if self.get_geo_reference_system() == 'latlon':
+            coordinates = self._get_coordinates_array()
+            _latlon_to_cartesian_(coordinates)
+            self._set_coordinates_(coordinates)
+            for point in self:
+                point.set_geo_reference_system('cartesian')
+        elif not ignore_warnings:
+            warnings.warn("Geo reference system is already cartesian.")
 
     def to_latlon(self, ignore_warnings=False):
         """
@@ -384,6 +591,9 @@ class Route(list):
         route_cartesian : Route
             A copy of this route with each point in a latlon geo reference system.
         """
+        if len(self) > 0 and self.get_geo_reference_system() == 'cartesian':
+            # copy and convert the points in a single pass
+            return self.convert(geo_reference_system='latlon')
         route_copy = self.deep_copy()
         route_copy.to_latlon_(ignore_warnings)
         return route_copy
@@ -397,8 +607,87 @@ class Route(list):
         ignore_warnings : bool
             If True, no warning is thrown, when the geo reference system is already 'latlon'.
         """
-        for point in self:
-            point.to_latlon_(ignore_warnings)
+        if len(self) == 0:
+            return
+        if self.get_geo_reference_system() == 'cartesian':
+            coordinates = self._get_coordinates_array()
+            _cartesian_to_latlon_(coordinates)
+            self._set_coordinates_(coordinates)
+            for point in self:
+                point.set_geo_reference_system('latlon')
+        elif not ignore_warnings:
+            warnings.warn("Geo reference system is already latlon.")
+
+    def _get_coordinates_array(self):
+        """
+        Returns the coordinates of this route's points as an array.
+
+        Returns
+        -------
+        coordinates : np.ndarray
+            An array of shape (len(self), 2) holding the x- and y-coordinate of each point.
+        """
+        return np.asarray(self, dtype=np.float64).reshape(-1, 2)
+
+    def _get_timestamps_array(self):
+        """
+        Returns the timestamps of this route's points as an array. This method only applies to routes with items of
+        type PointT.
+
+        Returns
+        -------
+        timestamps : np.ndarray
+            An array of shape (len(self),) holding the timestamp of each point in nanoseconds since epoch.
+        """
+        return np.fromiter((point._timestamp_ns for point in self), dtype=np.int64, count=len(self))
+
+    def _set_coordinates_(self, coordinates):
+        """
+        Overwrites the coordinates of this route's points instantly.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            An array of shape (len(self), 2) holding the new x- and y-coordinate of each point.
+        """
+        for point, (x_lon, y_lat) in zip(self, coordinates.tolist()):
+            point.set_x_lon(x_lon)
+            point.set_y_lat(y_lat)
+
+    def _convert_coordinates_unit_(self, target_unit, factor, ignore_warnings):
+        """
+        Converts the coordinates of this route's points instantly into target_unit by multiplying all coordinates with
+        factor in a single vectorized operation. Single point routes are converted with scalar arithmetic.
+
+        Parameters
+        ----------
+        target_unit : {'radians', 'degrees'}
+            The coordinates unit to convert into.
+        factor : float
+            The conversion factor from the current to the target unit.
+        ignore_warnings : bool
+            If True, no warning is thrown, when the coordinates unit is already target_unit.
+        """
+        if len(self) == 0:
+            return
+        geo_reference_system, coordinates_unit = self._get_format()
+        if geo_reference_system != 'latlon':
+            raise ValueError("The coordinates can only be converted if the geo reference system is 'latlon.")
+        if coordinates_unit == target_unit:
+            if not ignore_warnings:
+                warnings.warn(f"Coordinates unit is already '{target_unit}'.")
+        elif len(self) == 1:
+            # scalar path for single point routes, where the array round trip costs more than it saves
+            point = self[0]
+            point.set_x_lon(point.x_lon * factor)
+            point.set_y_lat(point.y_lat * factor)
+            point.set_coordinates_unit(target_unit)
+        else:
+            coordinates = self._get_coordinates_array()
+            np.multiply(coordinates, factor, out=coordinates)
+            self._set_coordinates_(coordinates)
+            for point in self:
+                point.set_coordinates_unit(target_unit)
 
     def to_radians_(self, ignore_warnings=False):
         """
@@ -411,8 +700,7 @@ class Route(list):
         ignore_warnings : bool
             If True, no warning is thrown, when the coordinates unit is already 'radians'.
         """
-        for point in self:
-            point.to_radians_(ignore_warnings)
+        self._convert_coordinates_unit_('radians', DEG2RAD, ignore_warnings)
 
     def to_radians(self, ignore_warnings=False):
         """
@@ -430,6 +718,9 @@ class Route(list):
             A copy of this route where the coordinates have been converted into 'radians' if the unit is 'degrees' and
             the geo_reference_system of its points is 'latlon'.
         """
+        if len(self) > 0 and self._get_format() == ('latlon', 'degrees'):
+            # copy and convert the points in a single pass
+            return self.convert(coordinates_unit='radians')
         route_copy = self.deep_copy()
         route_copy.to_radians_(ignore_warnings)
         return route_copy
@@ -445,8 +736,7 @@ class Route(list):
         ignore_warnings : bool
             If True, no warning is thrown, when the coordinates unit is already 'degrees'.
         """
-        for point in self:
-            point.to_degrees_(ignore_warnings)
+        self._convert_coordinates_unit_('degrees', RAD2DEG, ignore_warnings)
 
     def to_degrees(self, ignore_warnings=False):
         """
@@ -464,10 +754,138 @@ class Route(list):
             A copy of this route where the coordinates have been converted into 'degrees' if the unit is 'radians' and
             the geo_reference_system of its points is 'latlon'.
         """
+        if len(self) > 0 and self._get_format() == ('latlon', 'radians'):
+            # copy and convert the points in a single pass
+            return self.convert(coordinates_unit='degrees')
         route_copy = self.deep_copy()
         route_copy.to_degrees_(ignore_warnings)
         return route_copy
 
+    def convert_(self, geo_reference_system=None, coordinates_unit=None):
+        """
+        Converts this route instantly into the given geo reference system and coordinates unit in a single pass over
+        its coordinates. The result equals chaining the corresponding conversions, e.g. to_radians_() followed by
+        to_cartesian_(), but the coordinates are only read and written once. The coordinates unit is converted while
+        the route is in 'latlon' format, i.e. before projecting into or after projecting from 'cartesian'. Since the
+        projection into 'cartesian' expects radians, converting into 'degrees' and 'cartesian' at once raises a
+        ValueError. No warning is thrown, if the route is already in the target format.
+
+        Parameters
+        ----------
+        geo_reference_system : {'latlon', 'cartesian'}, optional
+            The target geo reference system. If None, the geo reference system is not changed.
+        coordinates_unit : {'radians', 'degrees'}, optional
+            The target coordinates unit. If None, the coordinates unit is not changed.
+
+        Returns
+        -------
+        Route
+            This route converted into the target geo reference system and coordinates unit.
+        """
+        if len(self) > 0:
+            coordinates, target_geo_reference_system, target_coordinates_unit = \
+                self._get_converted_coordinates(geo_reference_system, coordinates_unit)
+            _set_points_(self, coordinates, target_geo_reference_system, target_coordinates_unit)
+        return self
+
+    def _get_converted_coordinates(self, geo_reference_system, coordinates_unit):
+        """
+        Converts the coordinates of this non-empty route into the given geo reference system and coordinates unit in a
+        single pass without modifying the route. See convert_() for details.
+
+        Returns
+        -------
+        coordinates, target_geo_reference_system, target_coordinates_unit : np.ndarray, str, str
+            The converted coordinates as an array of shape (len(self), 2) and the geo reference system and coordinates
+            unit that they refer to.
+        """
+        source_geo_reference_system, source_coordinates_unit = self._get_format()
+        target_geo_reference_system = geo_reference_system or source_geo_reference_system
+        target_coordinates_unit = coordinates_unit or source_coordinates_unit
+        if target_geo_reference_system not in _VALID_CRS:
+            raise ValueError("Geo reference system can only be 'latlon' or 'cartesian'.")
+        if target_coordinates_unit not in _VALID_UNITS:
+            raise ValueError("Coordinates unit can only be 'radians' or 'degrees'.")
+        convert_unit = target_coordinates_unit != source_coordinates_unit
+        if convert_unit and 'latlon' not in (source_geo_reference_system, target_geo_reference_system):
+            raise ValueError("The coordinates can only be converted if the geo reference system is 'latlon.")
+        # the projection into 'cartesian' expects the latitude and longitude in radians
+        if convert_unit and target_geo_reference_system == 'cartesian' and target_coordinates_unit == 'degrees':
+            raise ValueError("The coordinates can only be projected into 'cartesian' in 'radians'.")
+
+        coordinates = self._get_coordinates_array()
+        if source_geo_reference_system == 'cartesian' and target_geo_reference_system == 'latlon':
+            _cartesian_to_latlon_(coordinates)
+        if convert_unit:
+            np.multiply(coordinates, DEG2RAD if target_coordinates_unit == 'radians' else RAD2DEG, out=coordinates)
+        if source_geo_reference_system == 'latlon' and target_geo_reference_system == 'cartesian':
+            _latlon_to_cartesian_(coordinates)
+        return coordinates, target_geo_reference_system, target_coordinates_unit
+
+    def convert(self, geo_reference_system=None, coordinates_unit=None):
+        """
+        Returns a copy of this route converted into the given geo reference system and coordinates unit in a single
+        pass over its coordinates. See convert_() for details.
+
+        Parameters
+        ----------
+        geo_reference_system : {'latlon', 'cartesian'}, optional
+            The target geo reference system. If None, the geo reference system is not changed.
+        coordinates_unit : {'radians', 'degrees'}, optional
+            The target coordinates unit. If None, the coordinates unit is not changed.
+
+        Returns
+        -------
+        Route
+            A copy of this route converted into the target geo reference system and coordinates unit.
+        """
+        route_copy = Route()
+        if len(self) > 0:
+            coordinates, target_geo_reference_system, target_coordinates_unit = \
+                self._get_converted_coordinates(geo_reference_system, coordinates_unit)
+            # copy and convert the points in the same pass instead of converting a deep copy afterwards
+            points = list(map(Point.deep_copy, self))
+            _set_points_(points, coordinates, target_geo_reference_system, target_coordinates_unit)
+            super(Route, route_copy).extend(points)
+        return route_copy
+
+    @staticmethod
+    def batch_convert_(routes, geo_reference_system=None, coordinates_unit=None):
+        """
+        Converts several routes instantly into the given geo reference system and coordinates unit. Routes that share
+        the same geo reference system and coordinates unit are converted together in a single pass over all of their
+        coordinates. The result equals calling convert_() on each route, except that no route is modified if any route
+        cannot be converted.
+
+        Parameters
+        ----------
+        routes : Iterable
+            The routes to convert.
+        geo_reference_system : {'latlon', 'cartesian'}, optional
+            The target geo reference system. If None, the geo reference system is not changed.
+        coordinates_unit : {'radians', 'degrees'}, optional
+            The target coordinates unit. If None, the coordinates unit is not changed.
+
+        Returns
+        -------
+        List
+            A list of the converted routes.
+        """
+        routes = list(routes)
+        groups = {}
+        for route in routes:
+            if len(route) > 0:
+                key = route._get_format()
+                groups.setdefault(key, Route())
+                # the merged route holds the same point objects, so converting it converts the routes of the group
+                super(Route, groups[key]).extend(route)
+        # convert all groups before modifying any route, so that the routes are left unchanged if a group raises
+        conversions = [merged_route._get_converted_coordinates(geo_reference_system, coordinates_unit)
+                       for merged_route in groups.values()]
+        for merged_route, conversion in zip(groups.values(), conversions):
+            _set_points_(merged_route, *conversion)
+        return routes
+
     def max_speed(self, time_between_route_points):
         """
         Returns the maximum speed in kilometers per hour of the taxi when driving this route, assuming that the time
@@ -484,14 +902,54 @@ class Route(list):
             The maximum speed of the taxi in kilometers per hour, when driving the route.
         """
         maximum_speed_kmh = 0
-        for i in range(len(self) - 1):
-            distance = get_distance(self[i], self[i + 1])
-            current_speed_ms = distance / time_between_route_points.total_seconds()
-            current_speed_kmh = current_speed_ms * 3_600 / 1_000
-            if current_speed_kmh > maximum_speed_kmh:
-                maximum_speed_kmh = current_speed_kmh
+        if len(self) > 1:
+            maximum_distance = _get_max_consecutive_distance(self._get_coordinates_array(), *self._get_format())
+            maximum_speed_ms = maximum_distance / time_between_route_points.total_seconds()
+            maximum_speed_kmh = max(maximum_speed_kmh, maximum_speed_ms * 3_600 / 1_000)
         return maximum_speed_kmh
 
+    @staticmethod
+    def max_speeds(routes, time_between_route_points):
+        """
+        Returns the maximum speed in kilometers per hour for each of the indicated routes, as calculated by
+        max_speed(). If all routes share the same geo reference system and coordinates unit, the distances between
+        consecutive points of all routes are calculated in one vectorized pass over their concatenated coordinates.
+
+        Parameters
+        ----------
+        routes : list[Route]
+            The routes to calculate the maximum speed for.
+        time_between_route_points : pd.Timedelta
+            The time between consecutive route points.
+
+        Returns
+        -------
+        maximum_speeds_kmh : np.ndarray
+            The maximum speed in kilometers per hour for each route. Routes with less than two points have a maximum
+            speed of 0.
+        """
+        routes = list(routes)
+        lengths = np.fromiter(map(len, routes), dtype=np.int64, count=len(routes))
+        maximum_speeds_kmh = np.zeros(len(routes))
+        has_distances = lengths > 1
+        if not has_distances.any():
+            return maximum_speeds_kmh
+        formats = {route._get_format() for route in routes if len(route) > 0}
+        if len(formats) > 1:
+            return np.array([route.max_speed(time_between_route_points) for route in routes], dtype=np.float64)
+
+        coordinates = np.asarray(list(itertools.chain.from_iterable(routes)), dtype=np.float64).reshape(-1, 2)
+        distances = _get_consecutive_distances(coordinates, *formats.pop())
+        # the distance from the last point of a route to the first point of the next one is no valid distance
+        ends = np.cumsum(lengths)
+        boundaries = ends[(ends > 0) & (ends < len(coordinates))] - 1
+        distances[boundaries] = 0
+        starts = (ends - lengths)[has_distances]
+        maximum_distances = np.maximum.reduceat(distances, starts)
+        maximum_speeds_ms = maximum_distances / time_between_route_points.total_seconds()
+        maximum_speeds_kmh[has_distances] = maximum_speeds_ms * 3_600 / 1_000
+        return maximum_speeds_kmh
+
     def get_average_point(self):
         """
         Calculates the average position from all points of this route. If this route contains points with timestamp,
@@ -504,6 +962,5 @@ class Route(list):
         """
         avg_point = None
         if len(self) > 0:
-            avg_point = Point([np.mean([point.x_lon for point in self]), np.mean([point.y_lat for point in self])],
-                              self[0].get_geo_reference_system(), self.get_coordinates_unit())
+            avg_point = Point(self._get_coordinates_array().mean(axis=0).tolist(), *self._get_format())
         return avg_point
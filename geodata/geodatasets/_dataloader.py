@@ -0,0 +1,69 @@
+"""Provides the creation of data loaders shared by the dataset classes.
+"""
+import os
+
+import torch
+from torch.utils.data import DataLoader
+# imported from the dataloader module, which also provides it in torch versions before 1.11
+from torch.utils.data.dataloader import default_collate
+
+from geodata.geodata.route import Route
+
+
+def collate_samples(samples):
+    """
+    Collates data samples into a batch like torch's default_collate, but also in worker processes when sample tensors
+    require gradients. The tensors are collated detached, since worker processes collate into shared memory, which
+    autograd does not support. The batched tensors of those requiring gradients then require gradients themselves.
+    Routes are not collated, but batched as a list of the samples' routes, since default_collate would merge their
+    points coordinate by coordinate and drop the timestamps.
+
+    Parameters
+    ----------
+    samples : list[dict]
+        The data samples to collate.
+
+    Returns
+    -------
+    batch : dict
+        The collated batch with the keys of the samples. Tensors are stacked along a new first dimension of size
+        len(samples), while routes, e.g. 'route_with_timestamps', are a list holding the Route of each sample in order.
+    """
+    route_keys = [key for key, value in samples[0].items() if isinstance(value, Route)]
+    keys_requiring_grad = [key for key, value in samples[0].items() if torch.is_tensor(value) and value.requires_grad]
+    samples_to_collate = [{key: value.detach() if key in keys_requiring_grad else value
+                           for key, value in sample.items() if key not in route_keys} for sample in samples]
+    batch = default_collate(samples_to_collate)
+    for key in keys_requiring_grad:
+        batch[key].requires_grad_(True)
+    for key in route_keys:
+        batch[key] = [sample[key] for sample in samples]
+    return batch
+
+
+def create_dataloader(dataset, batch_size=1, num_workers=0):
+    """
+    Creates a data loader that loads the samples of the dataset in their order, optionally fetching them in parallel
+    worker processes.
+
+    Parameters
+    ----------
+    dataset : torch.utils.data.Dataset
+        The dataset to load, whose samples are dicts.
+    batch_size : int
+        The number of samples per batch.
+    num_workers : int
+        The number of worker processes loading the samples. If 0, the samples are loaded in the main process. If -1,
+        one worker per CPU is used.
+
+    Returns
+    -------
+    dataloader : torch.utils.data.DataLoader
+        A data loader over the dataset. Its workers are kept alive between iterations over the dataset. Its batches are
+        collated by collate_samples(), so the routes of a batch are a list of Route objects, one per sample, instead of
+        being collated point by point.
+    """
+    if num_workers == -1:
+        num_workers = os.cpu_count() or 0
+    return DataLoader(dataset, batch_size=batch_size, shuffle=False, num_workers=num_workers,
+                      persistent_workers=num_workers > 0, pin_memory=False, collate_fn=collate_samples)
@@ -14,6 +14,7 @@ from torch.nn.functional import one_hot
 from geodata.geodata.point_t import PointT
 from geodata.geodata.point import Point
 from geodata.geodata.route import Route
+from geodata.geodatasets._dataloader import create_dataloader
 
 
 class De4lSensorDataset(Dataset):
@@ -50,18 +51,48 @@ class De4lSensorDataset(Dataset):
         else:
             self.location_bounds = location_bounds
 
-        data_frame["timestamp"] = data_frame["timestamp"].apply(self.parse_date)
-
-        # day of the week from 0 to 6
-        data_frame["day_of_week"] = data_frame["timestamp"].apply(lambda x: x.isoweekday() - 1)
-        # quarter of an hour from 0 to 95 (4 quarters per hour times 24 hours per day)
-        data_frame["quarter_hour_of_day"] = data_frame["timestamp"].apply(
-            lambda x: x.hour * 4 + int(np.floor(x.minute / 15))
-        )
-        # month of the year from 0 to 11
-        data_frame["month"] = data_frame["timestamp"].apply(lambda x: x.month - 1)
+        timestamps = data_frame["timestamp"]
+        # timestamps might already be parsed, e.g. by pandas.read_json
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            if pd.api.types.infer_dtype(timestamps, skipna=False) == 'string':
+                try:
+                    # parse all timestamp strings at once instead of one by one
+                    timestamps = pd.to_datetime(timestamps)
+                except (ValueError, TypeError):
+                    # pandas infers one format from the first timestamp, which fails e.g. for timestamps that mix
+                    # fractional and whole seconds, so these are parsed one by one
+                    timestamps = timestamps.apply(self.parse_date)
+            else:
+                timestamps = timestamps.apply(self.parse_date)
+            data_frame["timestamp"] = timestamps
+
+        if pd.api.types.is_datetime64_any_dtype(data_frame["timestamp"]):
+            timestamps = data_frame["timestamp"].dt
+            # day of the week from 0 to 6
+            data_frame["day_of_week"] = timestamps.dayofweek.astype(np.int64)
+            # quarter of an hour from 0 to 95 (4 quarters per hour times 24 hours per day)
+            data_frame["quarter_hour_of_day"] = (timestamps.hour * 4 + timestamps.minute // 15).astype(np.int64)
+            # month of the year from 0 to 11
+            data_frame["month"] = (timestamps.month - 1).astype(np.int64)
+        else:
+            # day of the week from 0 to 6
+            data_frame["day_of_week"] = data_frame["timestamp"].apply(lambda x: x.isoweekday() - 1)
+            # quarter of an hour from 0 to 95 (4 quarters per hour times 24 hours per day)
+            data_frame["quarter_hour_of_day"] = data_frame["timestamp"].apply(
+                lambda x: x.hour * 4 + int(np.floor(x.minute / 15))
+            )
+            # month of the year from 0 to 11
+            data_frame["month"] = data_frame["timestamp"].apply(lambda x: x.month - 1)
         self.data_frame = data_frame
 
+        # create the padded route tensors of all routes at once, so that they are not created per sample
+        longitudes = np.fromiter((location["lon"] for location in data_frame["location"]), dtype=np.float64)
+        latitudes = np.fromiter((location["lat"] for location in data_frame["location"]), dtype=np.float64)
+        coordinates = np.radians(np.column_stack((longitudes, latitudes)))
+        self._route_tensor_raw_padded = self._get_padded_route_tensor(coordinates)
+        coordinates_scaled = Route.make_scaler(self.location_bounds)(coordinates.copy())
+        self._route_tensor_scaled_padded = self._get_padded_route_tensor(coordinates_scaled)
+
     def __len__(self):
         return int(np.ceil(len(self.data_frame) / self.route_len))
 
@@ -95,13 +126,11 @@ class De4lSensorDataset(Dataset):
         month_one_hot = torch.zeros([self.route_len, 12], dtype=torch.float64)
 
         route_idx = 0
-        route = Route()
         route_with_timestamps = Route()
         for i in range(start_idx, min(start_idx + self.route_len, len(self.data_frame))):
             location = self.data_frame.loc[i, "location"]
             timestamp = self.data_frame.loc[i, "timestamp"]
             point = Point([radians(location["lon"]), radians(location["lat"])])
-            route.append(point)
             point_with_timestamp = PointT(point, timestamp=timestamp)
             route_with_timestamps.append(point_with_timestamp)
 
@@ -114,14 +143,9 @@ class De4lSensorDataset(Dataset):
             month_one_hot[route_idx] = one_hot(torch.tensor(self.data_frame.loc[i, "month"]), num_classes=12)
             route_idx += 1
 
-        route_raw_padded = Route(route)
-        route_raw_padded.pad(self.route_len)
-        route_tensor_raw_padded = torch.tensor(route_raw_padded, dtype=torch.float64, requires_grad=True)
-
-        route_scaled_padded = Route(route)
-        route_scaled_padded.scale(self.location_bounds)
-        route_scaled_padded.pad(self.route_len)
-        route_tensor_scaled_padded = torch.tensor(route_scaled_padded, dtype=torch.float64, requires_grad=True)
+        # copy the precomputed route tensors, so that every sample is a leaf tensor of its own
+        route_tensor_raw_padded = self._route_tensor_raw_padded[idx].clone().requires_grad_(True)
+        route_tensor_scaled_padded = self._route_tensor_scaled_padded[idx].clone().requires_grad_(True)
 
         sample = {
             "day_of_week": day_of_week_one_hot,
@@ -135,6 +159,36 @@ class De4lSensorDataset(Dataset):
 
         return sample
 
+    def _get_padded_route_tensor(self, coordinates):
+        """
+        Splits the coordinates of all data points into routes of length route_len and pads the last route with zero
+        values.
+
+        Parameters
+        ----------
+        coordinates : np.ndarray
+            An array of shape (len(self.data_frame), 2) holding the coordinates of each data point.
+
+        Returns
+        -------
+        route_tensor_padded : torch.Tensor
+            A tensor of shape (len(self), route_len, 2) holding the coordinates of each route.
+        """
+        route_tensor_padded = torch.zeros([len(self) * self.route_len, 2], dtype=torch.float64)
+        route_tensor_padded[:len(coordinates)] = torch.from_numpy(coordinates)
+        return route_tensor_padded.view(len(self), self.route_len, 2)
+
+    def get_dataloader(self, batch_size=1, num_workers=0):
+        """
+        Creates a data loader over the sensor samples of this dataset, see create_dataloader().
+
+        Returns
+        -------
+        dataloader : torch.utils.data.DataLoader
+            A data loader over this dataset.
+        """
+        return create_dataloader(self, batch_size, num_workers)
+
     @classmethod
     def parse_date(cls, date):
         """
@@ -175,10 +229,12 @@ class De4lSensorDataset(Dataset):
         longitude_min, longitude_max, latitude_min, latitude_max : float
             The minimum and maximum location coordinates of all route points.
         """
-        longitude_min = min(data_frame["location"].apply(lambda x: radians(x["lon"])))
-        longitude_max = max(data_frame["location"].apply(lambda x: radians(x["lon"])))
-        latitude_min = min(data_frame["location"].apply(lambda x: radians(x["lat"])))
-        latitude_max = max(data_frame["location"].apply(lambda x: radians(x["lat"])))
+        # determine the bounds in degrees and convert only the four resulting values, which yields the same result as
+        # converting every coordinate, since the conversion is monotonic
+        longitudes = np.fromiter((location["lon"] for location in data_frame["location"]), dtype=np.float64)
+        latitudes = np.fromiter((location["lat"] for location in data_frame["location"]), dtype=np.float64)
+        longitude_min, longitude_max = radians(longitudes.min()), radians(longitudes.max())
+        latitude_min, latitude_max = radians(latitudes.min()), radians(latitudes.max())
         return longitude_min, longitude_max, latitude_min, latitude_max
 
     @classmethod
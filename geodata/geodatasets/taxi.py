@@ -4,6 +4,8 @@ process and work with this dataset.
 Source: https://www.kaggle.com/c/pkdd-15-taxi-trip-time-prediction-ii/data
 """
 import datetime
+import itertools
+from importlib.util import find_spec
 
 import torch
 import numpy as np
@@ -14,7 +16,17 @@ from torch.utils.data import Dataset
 
 from geodata.helper import parser
 from geodata.geodata.route import Route
-from geodata.geodata.point import get_distance
+from geodata.geodatasets._dataloader import create_dataloader
+
+# parse whole csv files with pyarrow if it is installed, which is optional
+_READ_CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') is not None else 'c'
+# the identifiers of callers and stands are NULL for some call types, which the pyarrow parser reads as None and the C
+# parser as NaN. They are read as floats, so that both parsers yield the same data frame. The types of the other columns
+# are inferred.
+_CSV_DTYPES = {
+    'ORIGIN_CALL': np.float64,
+    'ORIGIN_STAND': np.float64,
+}
 
 
 class TaxiServiceTrajectoryDataset(Dataset):
@@ -73,15 +85,16 @@ class TaxiServiceTrajectoryDataset(Dataset):
         self.max_allowed_speed_kmh = max_allowed_speed_kmh
         self.min_route_length = min_route_length if min_route_length >= 1 else 1
 
-        # create a Route object ('lonlat' and 'radians') from 'POLYLINE' ('lonlat' and 'degrees')
+        # create a Route object ('lonlat' and 'radians') from 'POLYLINE' ('lonlat' and 'degrees'), converting all
+        # coordinates of a route into radians at once
         data_frame["route"] = data_frame["POLYLINE"].copy()\
             .apply(lambda polyline: parser.route_str_to_list(polyline) if polyline != '[]' else [])\
-            .apply(lambda route_list: Route(route_list, coordinates_unit='degrees').to_radians())
+            .apply(lambda route_list: Route.from_arrays(np.reshape(route_list, (-1, 2)), coordinates_unit='degrees')
+                   .convert_(coordinates_unit='radians'))
 
         data_frame['route_len'] = data_frame['route'].copy().transform(len)
 
-        data_frame['max_speed_kmh'] = data_frame['route'].copy()\
-            .apply(lambda route: self.max_speed(route, self.time_between_route_points))
+        data_frame['max_speed_kmh'] = Route.max_speeds(data_frame['route'], self.time_between_route_points)
 
         # drop data that contains errors
         error_constraints = [
@@ -117,6 +130,17 @@ class TaxiServiceTrajectoryDataset(Dataset):
                 self.location_bounds = self.calculate_location_bounds(data_frame)
             else:
                 self.location_bounds = location_bounds
+
+            # gather the coordinates of all routes once, so that the route tensors are not created from the route
+            # points per sample
+            coordinates = np.array(list(itertools.chain.from_iterable(data_frame["route"])), dtype=np.float64)
+            self._route_offsets = np.concatenate(([0], np.cumsum(data_frame["route"].transform(len))))
+            self._route_coordinates = torch.from_numpy(coordinates)
+            if self.scale:
+                scaler = Route.make_scaler(self.location_bounds)
+                self._route_coordinates_scaled = torch.from_numpy(scaler(coordinates.copy()))
+            else:
+                self._route_coordinates_scaled = self._route_coordinates
         else:
             raise Exception("The provided data does not contain enough valid entries.")
 
@@ -146,9 +170,7 @@ class TaxiServiceTrajectoryDataset(Dataset):
 
         timestamp_utc = self.data_frame.trip_time_start_utc.iloc[idx]
         timestamps = self.data_frame.timestamps.iloc[idx]
-        route = Route(self.data_frame.route.iloc[idx])
-        route_tensor_raw = torch.tensor(route, dtype=torch.float64, requires_grad=True)
-        route_len = len(route)
+        route_len = len(self.data_frame.route.iloc[idx])
 
         # initialize one hot representation
         day_of_week_one_hot = torch.zeros([route_len, 7], dtype=torch.float64)
@@ -169,22 +191,17 @@ class TaxiServiceTrajectoryDataset(Dataset):
             # advance timestamp
             timestamp_utc += self.time_between_route_points
 
-        # scale route points by location_bounds
-        if self.scale:
-            route.scale(self.location_bounds)
-
         # pad features to max_route_len
         pad_len = self.max_route_len - route_len
         pad = ZeroPad2d((0, 0, 0, pad_len))
         day_of_week_one_hot = pad(day_of_week_one_hot)
         quarter_hour_of_day_one_hot = pad(quarter_hour_of_day_one_hot)
         month_one_hot = pad(month_one_hot)
-        route_tensor_raw_padded = pad(route_tensor_raw)
-        route.pad(self.max_route_len)
-        route_tensor_scaled_padded = torch.tensor(route, dtype=torch.float64, requires_grad=True)
-        for _ in range(pad_len):
-            timestamps.append(timestamps[-1])
-        route_with_timestamps = Route(route, timestamps)
+        # copy the route points, scaled by location_bounds at initialization if requested, into zero padded tensors
+        route_tensor_raw_padded = self._get_padded_route_tensor(self._route_coordinates, idx)
+        route_tensor_scaled_padded = self._get_padded_route_tensor(self._route_coordinates_scaled, idx)
+        timestamps = timestamps + [timestamps[-1]] * pad_len
+        route_with_timestamps = Route(route_tensor_scaled_padded.tolist(), timestamps)
 
         sample = {
             "day_of_week": day_of_week_one_hot,
@@ -197,6 +214,38 @@ class TaxiServiceTrajectoryDataset(Dataset):
 
         return sample
 
+    def _get_padded_route_tensor(self, route_coordinates, idx):
+        """
+        Copies the coordinates of a route into a tensor that is padded with zero values to max_route_len.
+
+        Parameters
+        ----------
+        route_coordinates : torch.Tensor
+            A tensor of shape (N, 2) holding the coordinates of the points of all routes one after another.
+        idx : int
+            The index of a route.
+
+        Returns
+        -------
+        route_tensor_padded : torch.Tensor
+            A tensor of shape (max_route_len, 2) holding the coordinates of the route followed by zero values.
+        """
+        start, end = self._route_offsets[idx], self._route_offsets[idx + 1]
+        route_tensor_padded = torch.zeros([self.max_route_len, 2], dtype=torch.float64)
+        route_tensor_padded[:end - start] = route_coordinates[start:end]
+        return route_tensor_padded.requires_grad_(True)
+
+    def get_dataloader(self, batch_size=1, num_workers=0):
+        """
+        Creates a data loader over the route samples of this dataset, see create_dataloader().
+
+        Returns
+        -------
+        dataloader : torch.utils.data.DataLoader
+            A data loader over this dataset.
+        """
+        return create_dataloader(self, batch_size, num_workers)
+
     @classmethod
     def get_timestamps(cls, row, time_between_route_points):
         """
@@ -226,7 +275,7 @@ class TaxiServiceTrajectoryDataset(Dataset):
 
         Parameters
         ----------
-        route : Route
+        route : Route or list[Point]
             The route to check for maximum speed.
         time_between_route_points : pd.Timedelta
             The time between consecutive route points.
@@ -236,13 +285,9 @@ class TaxiServiceTrajectoryDataset(Dataset):
         maximum_speed_kmh : float
             The maximum speed of the taxi in kilometers per hour, when driving the route.
         """
-        maximum_speed_kmh = 0
-        for i in range(len(route) - 1):
-            current_speed_ms = get_distance(route[i], route[i + 1]) / time_between_route_points.total_seconds()
-            current_speed_kmh = current_speed_ms * 3600 / 1000
-            if current_speed_kmh > maximum_speed_kmh:
-                maximum_speed_kmh = current_speed_kmh
-        return maximum_speed_kmh
+        if not isinstance(route, Route):
+            route = Route(route)
+        return route.max_speed(time_between_route_points)
 
     @classmethod
     def calculate_location_bounds(cls, data_frame):
@@ -260,17 +305,19 @@ class TaxiServiceTrajectoryDataset(Dataset):
             The minimum and maximum location coordinates of all route points.
 
         """
-        longitude_min = min(data_frame["route"].apply(lambda x: min([p.x_lon for p in Route(x)])))
-        longitude_max = max(data_frame["route"].apply(lambda x: max([p.x_lon for p in Route(x)])))
-        latitude_min = min(data_frame["route"].apply(lambda x: min([p.y_lat for p in Route(x)])))
-        latitude_max = max(data_frame["route"].apply(lambda x: max([p.y_lat for p in Route(x)])))
+        # gather the points of all routes into one array to determine the bounds in a single vectorized pass
+        coordinates = np.array(list(itertools.chain.from_iterable(data_frame["route"])), dtype=np.float64)
+        longitude_min, latitude_min = coordinates.min(axis=0).tolist()
+        longitude_max, latitude_max = coordinates.max(axis=0).tolist()
         return longitude_min, longitude_max, latitude_min, latitude_max
 
     @classmethod
     def create_from_csv(cls, path, skiprows=None, nrows=None, max_allowed_speed_kmh=60, min_route_length=1):
         """
         Initializes a TaxiServiceTrajectoryDataset by reading from a csv. If size is given, only the first lines are
-        read. The csv file should at least have the columns mentioned in TaxiServiceTrajectoryDataset.__init__():
+        read. The nullable identifier columns are read as floats, so that the data frame does not depend on the csv parser,
+        which is pyarrow if it is installed. The csv file should at least have the columns mentioned in
+        TaxiServiceTrajectoryDataset.__init__():
             TRIP_ID: (String)
             CALL_TYPE: (char)
             ORIGIN_CALL: (integer)
@@ -307,7 +354,10 @@ class TaxiServiceTrajectoryDataset(Dataset):
         # keep first row as header
         if skiprows is not None:
             skiprows = range(1, skiprows + 1)
-        df = pd.read_csv(path, sep=',', encoding='latin1', skiprows=skiprows, nrows=nrows)
+        # the multithreaded pyarrow parser does not support reading parts of a file
+        engine = _READ_CSV_ENGINE if skiprows is None and nrows is None else 'c'
+        df = pd.read_csv(path, sep=',', encoding='latin1', skiprows=skiprows, nrows=nrows, engine=engine,
+                         dtype=_CSV_DTYPES)
         dataset = TaxiServiceTrajectoryDataset(data_frame=df, max_allowed_speed_kmh=max_allowed_speed_kmh,
                                                min_route_length=min_route_length)
         return dataset
@@ -350,13 +400,17 @@ class TaxiServiceTrajectoryDataset(Dataset):
         """
         # check file in chunks to find row numbers corresponding to start and end date
         # since the file is not sorted by timestamp, the results can differ depending on the used chunksize.
-        dataloader = pd.read_csv(path, sep=',', encoding='latin1', chunksize=5_000)
+        # only the timestamps are needed, which are compared as days since epoch instead of being converted into dates
+        dataloader = pd.read_csv(path, sep=',', encoding='latin1', usecols=['TIMESTAMP'], chunksize=5_000)
+        epoch = datetime.date(1970, 1, 1)
+        start_day = (datetime.datetime.fromisoformat(start_date).date() - epoch).days
+        end_day = (datetime.datetime.fromisoformat(end_date).date() - epoch).days
         start_idx = None
         end_idx = None
         for batch, df in enumerate(dataloader):
-            df['date'] = df['TIMESTAMP'].copy().apply(lambda x: datetime.datetime.utcfromtimestamp(int(x)).date())
-            df_start_date = df[df['date'] == datetime.datetime.fromisoformat(start_date).date()]
-            df_end_date = df[df['date'] == datetime.datetime.fromisoformat(end_date).date()]
+            days = df['TIMESTAMP'].astype(np.int64) // 86_400
+            df_start_date = df[days == start_day]
+            df_end_date = df[days == end_day]
             if start_idx is None and len(df_start_date) > 0:
                 start_idx = df_start_date.index.values[0]
             if end_idx is None and len(df_end_date) > 0:
@@ -1,6 +1,7 @@
 """A collection of functions to parse geodata.
 """
 
+import json
 import warnings
 
 import pandas as pd
@@ -23,8 +24,27 @@ def route_str_to_list(route_str):
     route_list : List
         The route converted into list format.
     """
-    route_str = route_str.replace("[[", "[").replace("]]", "]")
-    return points_str_to_list(route_str)
+    route_list = _json_route_str_to_list(route_str)
+    if route_list is None:
+        route_str = route_str.replace("[[", "[").replace("]]", "]")
+        route_list = points_str_to_list(route_str)
+    return route_list
+
+
+def _json_route_str_to_list(route_str):
+    """
+    Converts a route from string to list format with the C-accelerated json decoder, if the string is a JSON array
+    of coordinate pairs like the POLYLINE column of the taxi dataset. Otherwise, returns None.
+    """
+    try:
+        # integers are parsed as float directly, as the coordinates are returned as floats
+        route_list = json.loads(route_str, parse_int=float)
+    except ValueError:
+        return None
+    if type(route_list) is not list or not all(type(point) is list and len(point) == 2 and type(point[0]) is float
+                                               and type(point[1]) is float for point in route_list):
+        return None
+    return route_list
 
 
 def points_str_to_list(points_str):
@@ -67,7 +87,12 @@ def timestamps_str_to_list(timestamps_str):
     """
     timestamps_split = timestamps_str.replace('[', '').replace('Timestamp(', '').replace(')', '').replace(']', '') \
                            .replace(', ', '')[1:-1].split("''")
-    timestamps_list = [pd.Timestamp(split) for split in timestamps_split if split != '']
+    timestamps_split = [split for split in timestamps_split if split != '']
+    try:
+        # parse all timestamps at once, which fails e.g. for timestamps with differing time zones
+        timestamps_list = pd.DatetimeIndex(timestamps_split).tolist()
+    except (ValueError, TypeError):
+        timestamps_list = [pd.Timestamp(split) for split in timestamps_split]
     return timestamps_list
 
 
@@ -85,7 +110,24 @@ def float_str_to_list(float_str):
     float_list : List
         A list of float objects converted from float_str.
     """
-    float_list = [float(s) for s in float_str.replace('[', '').replace(']', '').replace(' ', '').split(',') if s != '']
+    float_list = _json_float_str_to_list(float_str)
+    if float_list is None:
+        float_list = [float(s) for s in float_str.replace('[', '').replace(']', '').replace(' ', '').split(',')
+                      if s != '']
+    return float_list
+
+
+def _json_float_str_to_list(float_str):
+    """
+    Converts a collection of floats from string to list format with the C-accelerated json decoder, if the string is a
+    JSON array of numbers. Otherwise, returns None.
+    """
+    try:
+        float_list = json.loads(float_str, parse_int=float)
+    except ValueError:
+        return None
+    if type(float_list) is not list or not all(type(value) is float for value in float_list):
+        return None
     return float_list
 
 
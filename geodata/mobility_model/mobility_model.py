@@ -28,7 +28,8 @@ class MobilityModel:
         ----------
         path_to_file : str
             The path pointing to the database file that will hold the mobility information of this model, including
-            file ending '.db'. The path to the folder of this file needs to exist.
+            file ending '.db'. The path to the folder of this file needs to exist. If ':memory:', the mobility
+            information is held in memory only and discarded when the database connection is closed.
         nominatim : Nominatim
             A running instance of Nominatim.
         ors_path : str
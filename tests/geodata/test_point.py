@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import math
 
@@ -6,22 +7,31 @@ import numpy as np
 from geodata.geodata.point import Point, get_bearing, get_distance, get_interpolated_point
 from geodata.helper.helper import get_digits
 
+# See example here: http://www.movable-type.co.uk/scripts/latlong.html
+# Values vary slightly due to the use of different earth_radius values
+# https://geodesyapps.ga.gov.au/vincenty-direct
+_LAT_START_RAD = math.radians(53.320556)  # 53°19′14″N
+_LON_START_RAD = math.radians(-1.729722)  # 001°43′47″W
+_LAT_END_RAD = math.radians(53.188432)  # 53°11′18″N
+_LON_END_RAD = math.radians(0.133333)  # 000°08'00"E
+_ANGLE_RAD = math.radians(96.021667)  # 096°01′18″
+_LAT_START_DEG = math.degrees(_LAT_START_RAD)
+_LON_START_DEG = math.degrees(_LON_START_RAD)
+
 
 class TestPointMethods(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # reference points are shared by all tests and frozen, so that no test can modify them
+        cls.point_radians = Point([_LON_START_RAD, _LAT_START_RAD], coordinates_unit='radians').freeze()
+        cls.point_degrees = Point([_LON_START_DEG, _LAT_START_DEG], coordinates_unit='degrees').freeze()
+
     def setUp(self):
-        # See example here: http://www.movable-type.co.uk/scripts/latlong.html
-        # Values vary slightly due to the use of different earth_radius values
-        # https://geodesyapps.ga.gov.au/vincenty-direct
-        self.lat_start = math.radians(53.320556)  # 53°19′14″N
-        lon_start = math.radians(-1.729722)  # 001°43′47″W
-        lat_end = math.radians(53.188432)  # 53°11′18″N
-        lon_end = math.radians(0.133333)    # 000°08'00"E
-        self.start_point = Point([lon_start, self.lat_start])
-        self.end_point = Point([lon_end, lat_end])
-        self.angle = math.radians(96.021667)  # 096°01′18″
+        self.lat_start = _LAT_START_RAD
+        self.start_point = Point([_LON_START_RAD, _LAT_START_RAD])
+        self.end_point = Point([_LON_END_RAD, _LAT_END_RAD])
+        self.angle = _ANGLE_RAD
         self.distance = 124_801  # meters
-        self.point_radians = Point([lon_start, self.lat_start], coordinates_unit='radians')
-        self.point_degrees = Point([math.degrees(lon_start), math.degrees(self.lat_start)], coordinates_unit='degrees')
         self.accuracy = 10
 
     def test_constructor(self):
@@ -72,6 +82,12 @@ class TestPointMethods(unittest.TestCase):
         except Exception:
             self.fail("Unexpected exception when invoking set_geo_reference_system().")
 
+        # values, that are not strings, are rejected, while subclasses of str are accepted
+        self.assertRaises(ValueError, point.set_geo_reference_system, ['cartesian'])
+        self.assertRaises(ValueError, point.set_coordinates_unit, ['degrees'])
+        point.set_geo_reference_system(type('S', (str,), {})('cartesian'))
+        self.assertEqual('cartesian', point.get_geo_reference_system())
+
     def test_add_vector_(self):
         self.start_point.add_vector_(self.distance, self.angle)
         accuracy = 4
@@ -161,9 +177,24 @@ class TestPointMethods(unittest.TestCase):
         # the original point object is not changed
         self.assertEqual(point, point_list[0])
 
+    def test_pickle(self):
+        for frozen in [False, True]:
+            point = Point([1, 1], geo_reference_system='cartesian', coordinates_unit='degrees')
+            if frozen:
+                point.freeze()
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                # the point and its attributes are restored with all pickle protocols
+                point_unpickled = pickle.loads(pickle.dumps(point, protocol=protocol))
+                self.assertEqual(Point, type(point_unpickled))
+                self.assertEqual(point, point_unpickled)
+                self.assertEqual(1, point_unpickled.x_lon)
+                self.assertEqual('cartesian', point_unpickled.get_geo_reference_system())
+                self.assertEqual('degrees', point_unpickled.get_coordinates_unit())
+                self.assertEqual(frozen, point_unpickled.is_frozen())
+
     def test_to_radians(self):
-        point_radians = self.point_radians.deep_copy()
-        point_degrees = self.point_degrees.deep_copy()
+        point_radians = self.point_radians
+        point_degrees = self.point_degrees
         # successfully converts between degrees and radians and changes the coordinates_unit
         point = point_degrees.deep_copy()
         self.assertAlmostEqual(point_radians.x_lon, point.to_radians().x_lon, places=self.accuracy)
@@ -182,8 +213,8 @@ class TestPointMethods(unittest.TestCase):
         self.assertEqual(point_radians.x_lon, point.x_lon)
 
     def test_to_radians_(self):
-        point_radians = self.point_radians.deep_copy()
-        point_degrees = self.point_degrees.deep_copy()
+        point_radians = self.point_radians
+        point_degrees = self.point_degrees
 
         # successfully converts between degrees and radians and changes the coordinates_unit while point is modified
         point = point_degrees.deep_copy()
@@ -201,8 +232,8 @@ class TestPointMethods(unittest.TestCase):
             point_radians.deep_copy().to_radians_()
 
     def test_to_degrees(self):
-        point_radians = self.point_radians.deep_copy()
-        point_degrees = self.point_degrees.deep_copy()
+        point_radians = self.point_radians
+        point_degrees = self.point_degrees
         point = point_radians.deep_copy()
 
         # successfully converts between degrees and radians and changes the coordinates_unit
@@ -221,8 +252,8 @@ class TestPointMethods(unittest.TestCase):
             point_degrees.to_degrees()
 
     def test_to_degrees_(self):
-        point_radians = self.point_radians.deep_copy()
-        point_degrees = self.point_degrees.deep_copy()
+        point_radians = self.point_radians
+        point_degrees = self.point_degrees
 
         # successfully converts between degrees and radians and changes the coordinates_unit while point is modified
         point = point_radians.deep_copy()
@@ -239,6 +270,47 @@ class TestPointMethods(unittest.TestCase):
         with self.assertWarns(Warning):
             point_degrees.deep_copy().to_degrees_()
 
+    def test_freeze(self):
+        point = Point([0, 0]).freeze()
+        self.assertTrue(point.is_frozen())
+        for modification in [
+            lambda: point.set_x_lon(1),
+            lambda: point.set_y_lat(1),
+            lambda: point.set_geo_reference_system('cartesian'),
+            lambda: point.set_coordinates_unit('degrees'),
+            point.to_cartesian_,
+            lambda: point.add_vector_(1, 0),
+            lambda: point.__setitem__(0, 1),
+            lambda: point.__delitem__(0),
+            lambda: point.__iadd__([1]),
+            lambda: point.__imul__(2),
+            lambda: point.insert(0, 1),
+            lambda: point.extend([1]),
+            point.pop,
+            lambda: point.remove(0),
+            point.clear,
+            point.reverse,
+            point.sort
+        ]:
+            self.assertRaises(TypeError, modification)
+        self.assertEqual([0, 0], point)
+        self.assertEqual('latlon', point.get_geo_reference_system())
+
+        # copies of a frozen point can be modified
+        point_copy = point.deep_copy()
+        self.assertFalse(point_copy.is_frozen())
+        point_copy.set_x_lon(1)
+        self.assertEqual(1, point_copy.x_lon)
+        self.assertEqual(0, point.x_lon)
+        self.assertFalse(point.to_degrees().is_frozen())
+
+        # list methods, that reorder the coordinates of a point that is not frozen, update its coordinates
+        point = Point([1.0, 2.0])
+        point.reverse()
+        self.assertEqual([2.0, 1.0], [point.x_lon, point.y_lat])
+        point.sort()
+        self.assertEqual([1.0, 2.0], [point.x_lon, point.y_lat])
+
     def test_is_coordinates_unit_valid(self):
         for illegal_argument, parameter in [
             [[np.pi + 0.1, np.pi], 'radians'],
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 import math
 import datetime
@@ -6,19 +7,21 @@ import pandas
 
 from geodata.geodata.point_t import PointT, get_interpolated_point
 
+# See example here: http://www.movable-type.co.uk/scripts/latlong.html
+# Values vary slightly due to the use of different earth_radius values
+# https://geodesyapps.ga.gov.au/vincenty-direct
+_LAT_START_RAD = math.radians(53.320556)  # 53°19′14″N
+_LON_START_RAD = math.radians(-1.729722)  # 001°43′47″W
+_LAT_END_RAD = math.radians(53.188432)  # 53°11′18″N
+_LON_END_RAD = math.radians(0.133333)  # 000°08'00"E
+_ANGLE_RAD = math.radians(96.021667)  # 096°01′18″
+
 
 class TestPointMethods(unittest.TestCase):
     def setUp(self):
-        # See example here: http://www.movable-type.co.uk/scripts/latlong.html
-        # Values vary slightly due to the use of different earth_radius values
-        # https://geodesyapps.ga.gov.au/vincenty-direct
-        lat_start = math.radians(53.320556)  # 53°19′14″N
-        lon_start = math.radians(-1.729722)  # 001°43′47″W
-        lat_end = math.radians(53.188432)  # 53°11′18″N
-        lon_end = math.radians(0.133333)  # 000°08'00"E
-        self.start_point = PointT([lon_start, lat_start], timestamp=pandas.Timestamp(1))
-        self.end_point = PointT([lon_end, lat_end], timestamp=pandas.Timestamp(2))
-        self.angle = math.radians(96.021667)  # 096°01′18″
+        self.start_point = PointT([_LON_START_RAD, _LAT_START_RAD], timestamp=pandas.Timestamp(1))
+        self.end_point = PointT([_LON_END_RAD, _LAT_END_RAD], timestamp=pandas.Timestamp(2))
+        self.angle = _ANGLE_RAD
         self.distance = 124_801  # meters
 
     def test_constructor(self):
@@ -35,6 +38,21 @@ class TestPointMethods(unittest.TestCase):
         except Exception:
             self.fail("Unexpected exception when invoking __init_().")
 
+    def test_timestamp(self):
+        # timestamps are returned unchanged, including their time zone
+        for timestamp in [
+            pandas.Timestamp(0),
+            pandas.Timestamp('2021-02-16T09:45:02.000Z'),
+            pandas.Timestamp('2021-02-16 09:45:02', tz='Europe/Berlin')
+        ]:
+            point = PointT([0, 0], timestamp=timestamp)
+            self.assertEqual(timestamp, point.timestamp)
+            self.assertEqual(timestamp.tz, point.timestamp.tz)
+
+        point = PointT([0, 0], timestamp=pandas.Timestamp(0))
+        with self.assertRaises(TypeError):
+            point.timestamp = 1
+
     def test_get_interpolated_point(self):
         ratio = 0.5
         # test interpolation on Earth
@@ -57,6 +75,32 @@ class TestPointMethods(unittest.TestCase):
 
         # the copy has the same parameters as the original
         point_copy = point.deep_copy()
+        self.assertEqual(PointT, type(point_copy))
         self.assertEqual(pandas.Timestamp(0), point_copy.timestamp)
         self.assertEqual('cartesian', point_copy.get_geo_reference_system())
         self.assertEqual('degrees', point_copy.get_coordinates_unit())
+
+    def test_freeze(self):
+        point = PointT([0.1, 0.2], timestamp=pandas.Timestamp(0)).freeze()
+        # the timestamp of a frozen point cannot be modified
+        with self.assertRaises(TypeError):
+            point.timestamp = pandas.Timestamp(5)
+        self.assertEqual(pandas.Timestamp(0), point.timestamp)
+        # the timestamp of a copy can be modified
+        point_copy = point.deep_copy()
+        point_copy.timestamp = pandas.Timestamp(5)
+        self.assertEqual(pandas.Timestamp(5), point_copy.timestamp)
+
+    def test_pickle(self):
+        for frozen in [False, True]:
+            point = PointT([1, 1], timestamp=pandas.Timestamp(1, tz='UTC'), coordinates_unit='degrees')
+            if frozen:
+                point.freeze()
+            for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+                # the point and its timestamp are restored with all pickle protocols
+                point_unpickled = pickle.loads(pickle.dumps(point, protocol=protocol))
+                self.assertEqual(PointT, type(point_unpickled))
+                self.assertEqual(point, point_unpickled)
+                self.assertEqual(pandas.Timestamp(1, tz='UTC'), point_unpickled.timestamp)
+                self.assertEqual('degrees', point_unpickled.get_coordinates_unit())
+                self.assertEqual(frozen, point_unpickled.is_frozen())
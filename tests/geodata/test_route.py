@@ -1,4 +1,5 @@
-import random
+import copy
+import pickle
 import unittest
 import math
 
@@ -32,6 +33,13 @@ class TestPointMethods(unittest.TestCase):
         ]:
             self.assertRaises(TypeError, Route.__init__, illegal_route_argument)
 
+        # coordinates outside the value range of the coordinates unit are rejected
+        self.assertRaises(Exception, Route, [[0, 0], [4, 0]])
+        self.assertRaises(Exception, Route, [[0, 0], [-8, 91]], coordinates_unit='degrees')
+        # invalid coordinates units are rejected
+        for coordinates_unit in ['meters', ['radians']]:
+            self.assertRaises(ValueError, Route, [[0, 0]], coordinates_unit=coordinates_unit)
+
         # successfully creates a Route
         self.assertEqual(Route, type(Route([[0, 0]])))
         self.assertEqual(Route, type(Route([[0, 0], [1, 1]])))
@@ -83,6 +91,46 @@ class TestPointMethods(unittest.TestCase):
         route_from_tensor = Route.from_torch_tensor(tensor)
         self.assertEqual(route, route_from_tensor)
 
+        # non-contiguous tensors of other float types are converted as well
+        tensor = torch.tensor([[0., 1.], [0., 1.]], dtype=torch.float32, requires_grad=True).t()
+        self.assertFalse(tensor.is_contiguous())
+        self.assertEqual(route, Route.from_torch_tensor(tensor))
+        self.assertEqual(float, type(Route.from_torch_tensor(tensor)[1].x_lon))
+
+    def test_from_arrays(self):
+        route = Route.from_arrays(np.array([[0., 0.], [1., 1.]]))
+        self.assertEqual(Route([[0, 0], [1, 1]]), route)
+        self.assertFalse(route.has_timestamps())
+
+        route = Route.from_arrays([[-8, 41], [-8.1, 41.1]], coordinates_unit='degrees')
+        self.assertEqual('degrees', route.get_coordinates_unit())
+
+        # points with timestamps are sorted by time
+        route = Route.from_arrays(np.array([[1., 1.], [0., 0.]]), np.array([5, 2], dtype=np.int64))
+        self.assertTrue(route.has_timestamps())
+        self.assertEqual(Route([[0, 0], [1, 1]]), route)
+        self.assertEqual([Timestamp(2), Timestamp(5)], route.get_timestamps())
+        self.assertTrue(all(type(point) is PointT for point in route))
+
+        for coordinates, timestamps in [
+            [np.zeros((2, 3)), None],
+            [np.zeros(2), None],
+            [np.zeros((2, 2)), np.zeros(3, dtype=np.int64)]
+        ]:
+            self.assertRaises(ValueError, Route.from_arrays, coordinates, timestamps)
+
+        # checks if the coordinates are in the valid value range
+        with self.assertRaises(ValueError):
+            Route.from_arrays([[0.1, 0.5], [np.pi + 0.1, np.pi]])
+        with self.assertRaises(ValueError):
+            Route.from_arrays([[-8, 41], [180.1, 90]], coordinates_unit='degrees')
+        self.assertEqual(2, len(Route.from_arrays([[-180, -90], [180, 90]], coordinates_unit='degrees')))
+        self.assertEqual(2, len(Route.from_arrays([[180.1, 90], [0, 200]], geo_reference_system='cartesian')))
+        with self.assertRaises(ValueError):
+            Route.from_arrays([[0.1, 0.5], [np.nan, 0.5]])
+        self.assertRaises(ValueError, Route.from_arrays, [[0, 0]], coordinates_unit='meters')
+        self.assertRaises(ValueError, Route.from_arrays, [[0, 0]], geo_reference_system='polar')
+
     def test_append(self):
         point_degrees = Point([-8, 41], coordinates_unit='degrees')
         point_radians = Point([3, 3], coordinates_unit='radians')
@@ -163,6 +211,18 @@ class TestPointMethods(unittest.TestCase):
         self.assertEqual(0, r[0].x_lon)
         self.assertEqual(1, r[0].y_lat)
 
+        r = Route([[-1, 1], [0.5, -0.5]]).scale((-1, 3, -1, 1))
+        self.assertEqual([[0, 1], [0.375, 0.25]], r)
+        self.assertRaises(ZeroDivisionError, Route([[0, 0]]).scale, (1, 1, -1, 1))
+
+    def test_make_scaler(self):
+        scaler = Route.make_scaler((-1, 3, -1, 1))
+        coordinates = np.array([[-1, 1], [0.5, -0.5]])
+        self.assertIs(coordinates, scaler(coordinates))
+        self.assertEqual([[0, 1], [0.375, 0.25]], coordinates.tolist())
+        self.assertEqual([[1, 0.5]], scaler(np.array([[3, 0]], dtype=np.float64)).tolist())
+        self.assertRaises(ZeroDivisionError, Route.make_scaler, (-1, 3, 1, 1))
+
     def test_inverse_scale(self):
         scale_values = (-1, 1, -1, 1)
         route = Route([[-1, 1]])
@@ -190,6 +250,16 @@ class TestPointMethods(unittest.TestCase):
             self.assertEqual(0, point.x_lon)
             self.assertEqual(0, point.y_lat)
 
+        # original points are kept unchanged and padding points share the route's unit and geo reference system
+        route = Route([[-8.123456789, 41.123456789]], coordinates_unit='degrees')
+        route.pad(target_len)
+        self.assertEqual([-8.123456789, 41.123456789], route[0])
+        self.assertEqual('degrees', route.get_coordinates_unit())
+        route = Route([Point([200, 300], 'cartesian')])
+        route.pad(target_len)
+        self.assertEqual([200, 300], route[0])
+        self.assertEqual('cartesian', route.get_geo_reference_system())
+
     def test_sort_by_time(self):
         # method only applicable for routes containing items of type PointT, but not Point
         with self.assertRaises(Exception):
@@ -199,12 +269,20 @@ class TestPointMethods(unittest.TestCase):
         except Exception:
             self.fail("Unexpected exception when invoking sort_by_time().")
 
-        route = Route()
-        for i in range(100):
-            route.append(PointT([1, 1], timestamp=Timestamp(random.randint(0, 1_000))))
+        route = Route.from_arrays(np.ones((100, 2)), np.random.randint(0, 1_000, size=100, dtype=np.int64))
+        # list.reverse does not sort, so sort_by_time has to restore the order
+        route.reverse()
         route.sort_by_time()
-        timestamps = [p.timestamp for p in route]
-        self.assertTrue(timestamps == sorted(timestamps))
+        # timestamps in nanoseconds since epoch are monotonically increasing
+        self.assertTrue(np.all(np.diff(route._get_timestamps_array()) >= 0))
+        self.assertEqual(Timestamp(route._get_timestamps_array()[0]), route[0].timestamp)
+
+        # tz-naive and tz-aware timestamps cannot be compared, while timestamps of different timezones can
+        self.assertRaises(TypeError, Route, [PointT([0, 0], timestamp=Timestamp(0)),
+                                             PointT([1, 1], timestamp=Timestamp(1, tz='UTC'))])
+        route = Route([PointT([0, 0], timestamp=Timestamp('2020-01-01 00:30', tz='UTC')),
+                       PointT([1, 1], timestamp=Timestamp('2020-01-01 01:00', tz='Europe/Berlin'))])
+        self.assertEqual(Route([[1, 1], [0, 0]]), route)
 
     def test_has_timestamps(self):
         self.assertFalse(self.route_without_timestamps.has_timestamps())
@@ -221,6 +299,22 @@ class TestPointMethods(unittest.TestCase):
             route_copy[0].to_cartesian_()
             self.assertEqual(0, route[0].x_lon)
             self.assertEqual('latlon', route[0].get_geo_reference_system())
+            # copy.deepcopy yields the same result as deep_copy
+            route_copy = copy.deepcopy(route)
+            self.assertEqual(route, route_copy)
+            self.assertEqual(Route, type(route_copy))
+            self.assertIsNot(route[0], route_copy[0])
+            self.assertEqual(route.has_timestamps(), route_copy.has_timestamps())
+
+    def test_pickle(self):
+        route = Route([PointT([0, 0], timestamp=Timestamp(0)), PointT([1, 1], timestamp=Timestamp(1)).freeze()])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            # the route and its points are restored with all pickle protocols
+            route_unpickled = pickle.loads(pickle.dumps(route, protocol=protocol))
+            self.assertEqual(Route, type(route_unpickled))
+            self.assertEqual(route, route_unpickled)
+            self.assertEqual(route.get_timestamps(), route_unpickled.get_timestamps())
+            self.assertEqual([False, True], [point.is_frozen() for point in route_unpickled])
 
     def test_delete_item_(self):
         route = Route([[0, 0], [1, 1]]).delete_point_at_(1)
@@ -229,6 +323,11 @@ class TestPointMethods(unittest.TestCase):
         self.assertEqual(Route, type(route))
         with self.assertRaises(KeyError):
             route.delete_point_at_(2)
+        with self.assertRaises(KeyError):
+            route.delete_point_at_(-2)
+        self.assertEqual(Route(), route.delete_point_at_(-1))
+        with self.assertRaises(KeyError):
+            route.delete_point_at_(0)
 
         route_with_timestamps = Route([PointT([0, 0], Timestamp(0)), PointT([1, 1], Timestamp(1))])
         self.assertTrue(route_with_timestamps.delete_point_at_(1).has_timestamps())
@@ -250,6 +349,21 @@ class TestPointMethods(unittest.TestCase):
         route = route_degrees.deep_copy()
         route.to_radians_()
         self.assertEqual(route_radians, route)
+        self.assertEqual('radians', route.get_coordinates_unit())
+
+        # if already in the target unit, throws a warning and does not change the route
+        with self.assertWarns(Warning):
+            route.to_radians_()
+        self.assertEqual(route_radians, route)
+
+        # cannot convert if geo reference system is not 'latlon'
+        with self.assertRaises(ValueError):
+            route_radians.to_cartesian().to_degrees_()
+
+        # single point routes are converted like their point
+        route = Route([Point([-8, 41], coordinates_unit='degrees')]).to_radians()
+        self.assertEqual([Point([-8, 41], coordinates_unit='degrees').to_radians()], route)
+        self.assertEqual('radians', route.get_coordinates_unit())
 
     def test_get_coordinates_unit(self):
         point_degrees_1 = Point([-8, 41], coordinates_unit='degrees')
@@ -283,6 +397,33 @@ class TestPointMethods(unittest.TestCase):
         route = Route([point_0, point_1, point_2])
         self.assertAlmostEqual(expected_max_speed_kmh, route.max_speed(time_between_route_points))
 
+        # latlon routes use the haversine distance in both units
+        point_0 = Point([math.radians(-8), math.radians(41)])
+        point_1 = Point([math.radians(-8.1), math.radians(41.1)])
+        point_2 = Point([math.radians(-8.11), math.radians(41.1)])
+        expected_max_speed_kmh = \
+            get_distance(point_0, point_1) * 3_600 / (1_000 * time_between_route_points.total_seconds())
+        route = Route([point_0, point_1, point_2])
+        self.assertAlmostEqual(expected_max_speed_kmh, route.max_speed(time_between_route_points))
+        self.assertAlmostEqual(expected_max_speed_kmh, route.to_degrees().max_speed(time_between_route_points))
+
+        # routes with less than two points have no speed
+        self.assertEqual(0, Route([point_0]).max_speed(time_between_route_points))
+
+    def test_max_speeds(self):
+        time_between_route_points = Timedelta(seconds=10)
+        routes = [Route([Point([-0.1, 0.7]), Point([-0.1001, 0.7002]), Point([-0.1003, 0.7002])]),
+                  Route(),
+                  Route([Point([-0.2, 0.6])]),
+                  Route([Point([0.1, 0.5]), Point([0.1002, 0.5])])]
+        expected_max_speeds_kmh = [route.max_speed(time_between_route_points) for route in routes]
+        self.assertEqual(expected_max_speeds_kmh, Route.max_speeds(routes, time_between_route_points).tolist())
+
+        # routes with different formats are handled one by one
+        routes.append(Route([Point([0, 0], 'cartesian'), Point([0, 100], 'cartesian')]))
+        expected_max_speeds_kmh.append(36.0)
+        self.assertEqual(expected_max_speeds_kmh, Route.max_speeds(routes, time_between_route_points).tolist())
+
     def test_conversion_geo_reference_systems(self):
         route_cartesian = Route([Point([0, 0], 'cartesian'),
                                  Point([0, 100], 'cartesian'),
@@ -302,6 +443,25 @@ class TestPointMethods(unittest.TestCase):
         for point in route:
             self.assertEqual('cartesian', point.get_geo_reference_system())
 
+        # converting a route yields the same coordinates as converting each of its points
+        route = Route([[0.1, 0.5], [-0.2, 0.3], [3, -1.4]])
+        for route_converted, convert_point in [
+            [route.to_cartesian(), lambda point: point.to_cartesian()],
+            [route.to_cartesian().to_latlon(), lambda point: point.to_cartesian().to_latlon()]
+        ]:
+            for point, point_converted in zip(route, route_converted):
+                expected_point = convert_point(point)
+                self.assertAlmostEqual(expected_point.x_lon, point_converted.x_lon, places=10)
+                self.assertAlmostEqual(expected_point.y_lat, point_converted.y_lat, places=10)
+                self.assertEqual(expected_point.get_geo_reference_system(),
+                                 point_converted.get_geo_reference_system())
+
+        # if already in the target geo reference system, throws a warning
+        with self.assertWarns(Warning):
+            route.to_latlon_()
+        with self.assertWarns(Warning):
+            route.to_cartesian().to_cartesian_()
+
         # coordinates unit is not changed even though the combination might not make sense
         route = Route([Point([0, 0], 'cartesian', 'degrees'),
                        Point([0, 100], 'cartesian', 'degrees'),
@@ -313,6 +473,64 @@ class TestPointMethods(unittest.TestCase):
         for point in route:
             self.assertEqual('degrees', point.get_coordinates_unit())
 
+    def test_convert(self):
+        route_degrees = Route([[-8, 41], [-8.1, 41.1]], coordinates_unit='degrees')
+        # converting in a single pass yields the same result as chaining the conversions
+        for route_converted, route_expected in [
+            [route_degrees.convert('cartesian', 'radians'), route_degrees.to_radians().to_cartesian()],
+            [route_degrees.convert(coordinates_unit='radians'), route_degrees.to_radians()],
+            [route_degrees.convert('cartesian', 'radians').convert('latlon', 'degrees'),
+             route_degrees.to_radians().to_cartesian().to_latlon().to_degrees()],
+            [route_degrees.convert(), route_degrees]
+        ]:
+            self.assertEqual(route_expected.get_geo_reference_system(), route_converted.get_geo_reference_system())
+            self.assertEqual(route_expected.get_coordinates_unit(), route_converted.get_coordinates_unit())
+            for point_expected, point_converted in zip(route_expected, route_converted):
+                self.assertAlmostEqual(point_expected.x_lon, point_converted.x_lon, places=10)
+                self.assertAlmostEqual(point_expected.y_lat, point_converted.y_lat, places=10)
+        # the original route is not changed
+        self.assertEqual([-8, 41], route_degrees[0])
+        self.assertEqual('degrees', route_degrees.get_coordinates_unit())
+
+        # routes are modified instantly
+        route = route_degrees.deep_copy()
+        route.convert_('cartesian', 'radians')
+        self.assertEqual('cartesian', route.get_geo_reference_system())
+
+        # the coordinates unit can only be converted in 'latlon' format
+        with self.assertRaises(ValueError):
+            route.convert_(coordinates_unit='degrees')
+        for illegal_arguments in [['invalid_value', None], [None, 'invalid_value']]:
+            self.assertRaises(ValueError, route_degrees.convert, *illegal_arguments)
+        # coordinates are only projected into 'cartesian' in 'radians'
+        route_radians = route_degrees.to_radians()
+        self.assertRaises(ValueError, route_radians.convert_, 'cartesian', 'degrees')
+        self.assertEqual(('latlon', 'radians'), (route_radians.get_geo_reference_system(),
+                                                 route_radians.get_coordinates_unit()))
+        self.assertEqual(Route(), Route().convert('cartesian', 'degrees'))
+
+    def test_batch_convert_(self):
+        routes = [Route([[-8, 41], [-8.1, 41.1]], coordinates_unit='degrees'),
+                  Route([[0.1, 0.5], [-0.2, 0.3], [3, -1.4]]),
+                  Route(),
+                  Route([Point([0, 100], 'cartesian'), Point([0, 150], 'cartesian')])]
+        expected_routes = [route.convert('latlon', 'degrees') for route in routes]
+        # the routes are converted instantly and returned as a list, also if they are given by a generator
+        converted_routes = Route.batch_convert_((route for route in routes), 'latlon', 'degrees')
+        self.assertEqual(len(routes), len(converted_routes))
+        for route, converted_route, expected_route in zip(routes, converted_routes, expected_routes):
+            self.assertIs(route, converted_route)
+            self.assertEqual(expected_route.get_geo_reference_system(), route.get_geo_reference_system())
+            self.assertEqual(expected_route.get_coordinates_unit(), route.get_coordinates_unit())
+            self.assertEqual(expected_route, route)
+
+        # no route is modified, if a route cannot be converted
+        routes = [Route([[0.1, 0.5], [-0.2, 0.3]]), Route([Point([0, 100], 'cartesian')])]
+        with self.assertRaises(ValueError):
+            Route.batch_convert_(routes, coordinates_unit='degrees')
+        self.assertEqual('radians', routes[0].get_coordinates_unit())
+        self.assertEqual([0.1, 0.5], routes[0][0])
+
     def test_get_average_point(self):
         point_a = Point([0, 1], geo_reference_system='cartesian', coordinates_unit='radians')
         point_b = Point([3, 8], geo_reference_system='cartesian', coordinates_unit='radians')
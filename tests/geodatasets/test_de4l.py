@@ -3,11 +3,9 @@ import unittest
 import math
 
 import dateutil.parser
-import torch
 import pandas as pd
 
 from geodata.geodatasets.de4l import De4lSensorDataset
-from geodata.geodata.route import Route
 from geodata.geodata.point_t import PointT
 
 
@@ -19,27 +17,57 @@ class TestDe4lSensorDataset(unittest.TestCase):
         # create a dataset with a certain route length, which creates routes from the data points
         self.dataset = De4lSensorDataset(self.data_frame, route_len)
         # create a dataloader that loads a single batch containing all routes
-        self.dataloader = torch.utils.data.DataLoader(self.dataset, shuffle=False)
+        self.dataloader = self.dataset.get_dataloader(num_workers=0)
+
+    def test_get_dataloader_workers(self):
+        self.setup_dataloader(file_path="tests/resources/test-sensor-dataset.json", route_len=60)
+        # samples loaded in worker processes equal those loaded in the main process
+        batches = list(self.dataset.get_dataloader(batch_size=2, num_workers=2))
+        expected_batches = list(self.dataset.get_dataloader(batch_size=2))
+        self.assertEqual(len(expected_batches), len(batches))
+        for batch, expected_batch in zip(batches, expected_batches):
+            self.assertTrue(batch["route_tensor_scaled_padded"].requires_grad)
+            for key in ["route_tensor_raw_padded", "route_tensor_scaled_padded"]:
+                self.assertTrue(batch[key].equal(expected_batch[key]))
+
+    def test_get_dataloader_batches(self):
+        self.setup_dataloader(file_path="tests/resources/test-sensor-dataset.json", route_len=60)
+        # each sample of a batch equals the sample loaded from the dataset
+        batch_size = 2
+        for batch_idx, batch in enumerate(self.dataset.get_dataloader(batch_size=batch_size)):
+            self.assertEqual(list, type(batch["route_with_timestamps"]))
+            for i, route_with_timestamps in enumerate(batch["route_with_timestamps"]):
+                sample = self.dataset[batch_idx * batch_size + i]
+                expected_route = sample["route_with_timestamps"]
+                self.assertEqual(expected_route, route_with_timestamps)
+                self.assertEqual(expected_route.get_timestamps(), route_with_timestamps.get_timestamps())
+                for key in ["route_tensor_raw_padded", "route_tensor_scaled_padded"]:
+                    self.assertTrue(batch[key][i].equal(sample[key]))
 
     def test__init__(self):
         route_len = 60
         self.setup_dataloader(file_path="tests/resources/test-sensor-dataset.json", route_len=route_len)
         for batch in self.dataloader:
-            for route_tensor in batch["route_tensor_scaled_padded"]:
-                # routes have same length
-                self.assertEqual(len(route_tensor), route_len)
-                # routes are scaled to [0, 1]
-                route = Route.from_torch_tensor(route_tensor.detach())
-                for point in route:
-                    self.assertGreaterEqual(point.x_lon, 0)
-                    self.assertGreaterEqual(1, point.x_lon)
-                    self.assertGreaterEqual(point.y_lat, 0)
-                    self.assertGreaterEqual(1, point.y_lat)
+            route_tensors = batch["route_tensor_scaled_padded"]
+            # routes have same length
+            self.assertEqual(route_len, route_tensors.shape[1])
+            # routes are scaled to [0, 1]
+            self.assertTrue(((route_tensors >= 0) & (route_tensors <= 1)).all())
 
         route_with_timestamps = self.dataset[0]["route_with_timestamps"]
         # route contains points with timestamps
         self.assertTrue(isinstance(route_with_timestamps[0], PointT))
 
+    def test_parse_timestamps(self):
+        data_frame = pd.read_json("tests/resources/test-sensor-dataset-small.json", lines=True)
+        # timestamps with and without fractional seconds are parsed
+        timestamps = ['2021-01-01T10:00:00.123Z', '2021-01-01T10:15:01Z']
+        data_frame["timestamp"] = timestamps
+        dataset = De4lSensorDataset(data_frame, route_len=1)
+        for timestamp, parsed_timestamp in zip(timestamps, dataset.data_frame["timestamp"]):
+            self.assertEqual(dateutil.parser.parse(timestamp), parsed_timestamp)
+        self.assertEqual([40, 41], dataset.data_frame["quarter_hour_of_day"].tolist())
+
     def test_parse_date(self):
         date_string = '2021-02-16T09:45:02.000Z'
         self.assertTrue(isinstance(De4lSensorDataset.parse_date(date_string), datetime.datetime))
@@ -1,41 +1,107 @@
+import functools
 import math
+import os
+import tempfile
 import unittest
-import torch
+from importlib.util import find_spec
 import pandas as pd
-from geodata.geodatasets.taxi import TaxiServiceTrajectoryDataset
-from geodata.geodata.route import Route
+from geodata.geodatasets.taxi import TaxiServiceTrajectoryDataset, _CSV_DTYPES
+from geodata.geodata.point import get_distance
+
+
+@functools.lru_cache(maxsize=None)
+def _read_csv_cached(file_path):
+    # parse with the C parser and inferred column types, so that the tests do not depend on whether pyarrow is installed
+    # and can compare the data frames of TaxiServiceTrajectoryDataset.create_from_csv() against a plain read
+    return pd.read_csv(file_path, sep=",", encoding="latin1", engine="c")
+
+
+def read_csv(file_path):
+    """
+    Reads each test file only once and returns a copy of its data frame, since datasets modify their data frame.
+    """
+    return _read_csv_cached(file_path).copy()
+
+
+@functools.lru_cache(maxsize=None)
+def load_dataset(file_path, scale=False, max_allowed_speed_kmh=None):
+    """
+    Builds the dataset of each test file and configuration only once. Tests share the returned dataset and must not
+    modify it.
+    """
+    return TaxiServiceTrajectoryDataset(read_csv(file_path), scale=scale, max_allowed_speed_kmh=max_allowed_speed_kmh)
 
 
 class TestTaxiServiceTrajectoryDataset(unittest.TestCase):
-    def setUp(self):
-        file_path = "tests/resources/test-taxi-dataset.csv"
-        # read the full dataset
-        data_frame = pd.read_csv(file_path, sep=",", encoding="latin1")
-        self.dataset = TaxiServiceTrajectoryDataset(data_frame, scale=True)
-        nr_routes = len(self.dataset)
-        # batch the full dataset
-        self.dataloader = torch.utils.data.DataLoader(self.dataset, shuffle=False, batch_size=nr_routes)
+    @classmethod
+    def setUpClass(cls):
+        # the full dataset is created once and shared by all tests, which do not modify it
+        cls.dataset = load_dataset("tests/resources/test-taxi-dataset.csv", scale=True)
+
+    @functools.cached_property
+    def dataloader(self):
+        # batch the full dataset, loading the few samples in the main process
+        return self.dataset.get_dataloader(batch_size=len(self.dataset), num_workers=0)
+
+    def test_get_dataloader(self):
+        dataloader = self.dataset.get_dataloader(batch_size=2)
+        self.assertEqual(0, dataloader.num_workers)
+        self.assertFalse(dataloader.persistent_workers)
+        self.assertEqual(2, dataloader.batch_size)
+        dataloader = self.dataset.get_dataloader(num_workers=-1)
+        self.assertEqual(os.cpu_count(), dataloader.num_workers)
+        self.assertTrue(dataloader.persistent_workers)
+
+    def test_get_dataloader_workers(self):
+        # load a small dataset in worker processes, which collate the samples into shared memory
+        dataset = load_dataset("tests/resources/test-taxi-dataset-small.csv", max_allowed_speed_kmh=120)
+        batches = list(dataset.get_dataloader(batch_size=1, num_workers=2))
+        self.assertEqual(len(dataset), len(batches))
+        for batch in batches:
+            self.assertEqual((1, dataset.max_route_len, 2), tuple(batch["route_scaled_padded"].shape))
+            self.assertTrue(batch["route_scaled_padded"].requires_grad)
+            self.assertEqual(dataset.max_route_len, len(batch["route_with_timestamps"][0]))
+
+    def test_get_dataloader_batches(self):
+        # each sample of a batch equals the sample loaded from the dataset
+        dataset = load_dataset("tests/resources/test-taxi-dataset-small.csv", max_allowed_speed_kmh=120)
+        batch_size = 2
+        for batch_idx, batch in enumerate(dataset.get_dataloader(batch_size=batch_size)):
+            self.assertEqual(list, type(batch["route_with_timestamps"]))
+            for i, route_with_timestamps in enumerate(batch["route_with_timestamps"]):
+                sample = dataset[batch_idx * batch_size + i]
+                expected_route = sample["route_with_timestamps"]
+                self.assertEqual(expected_route, route_with_timestamps)
+                self.assertEqual(expected_route.get_timestamps(), route_with_timestamps.get_timestamps())
+                for key in ["route", "route_scaled_padded"]:
+                    self.assertTrue(batch[key][i].equal(sample[key]))
 
     def test__max_route_len__(self):
         self.assertEqual(612, self.dataset.__max_route_len__())
 
     def test__init__(self):
         for batch in self.dataloader:
-            for route_tensor in batch["route_scaled_padded"]:
-                route = Route.from_torch_tensor(route_tensor.detach())
-                # routes are of max route length
-                self.assertEqual(len(route), self.dataset.max_route_len)
-                # routes are scaled to [0, 1]
-                for point in route:
-                    self.assertGreaterEqual(point.x_lon, 0)
-                    self.assertGreaterEqual(1, point.x_lon)
-                    self.assertGreaterEqual(point.y_lat, 0)
-                    self.assertGreaterEqual(1, point.y_lat)
+            route_tensors = batch["route_scaled_padded"]
+            # routes are of max route length
+            self.assertEqual(self.dataset.max_route_len, route_tensors.shape[1])
+            # routes are scaled to [0, 1]
+            self.assertTrue(((route_tensors >= 0) & (route_tensors <= 1)).all())
+
+    def test__getitem__(self):
+        sample = self.dataset[0]
+        route_len = len(self.dataset.data_frame.route.iloc[0])
+        self.assertEqual((self.dataset.max_route_len, 2), tuple(sample["route"].shape))
+        self.assertEqual(self.dataset.data_frame.route.iloc[0], sample["route"][:route_len].tolist())
+        self.assertFalse(sample["route"][route_len:].any())
+        self.assertEqual(sample["route_scaled_padded"].tolist(), sample["route_with_timestamps"])
+        # the route data is not modified by loading a sample
+        sample_reloaded = self.dataset[0]
+        for key in ["route", "route_scaled_padded"]:
+            self.assertTrue(sample[key].equal(sample_reloaded[key]))
+        self.assertEqual(route_len, len(self.dataset.data_frame.timestamps.iloc[0]))
 
     def test_calculate_location_bounds(self):
-        file_path = "tests/resources/test-taxi-dataset-small.csv"
-        data_frame = pd.read_csv(file_path, sep=",", encoding="latin1")
-        dataset = TaxiServiceTrajectoryDataset(data_frame, max_allowed_speed_kmh=120)
+        dataset = load_dataset("tests/resources/test-taxi-dataset-small.csv", max_allowed_speed_kmh=120)
         location_bounds = (math.radians(-8.610876000000001), math.radians(-8.585676),
                            math.radians(41.14557), math.radians(41.148638999999996))
         self.assertEqual(location_bounds, dataset.location_bounds)
@@ -56,6 +122,29 @@ class TestTaxiServiceTrajectoryDataset(unittest.TestCase):
         # test wrong path by slicing the first character off
         self.assertRaises(FileNotFoundError, lambda: TaxiServiceTrajectoryDataset.create_from_csv(path[1:]))
 
+    @unittest.skipIf(find_spec('pyarrow') is None, "pyarrow is not installed")
+    def test_create_from_csv_engines(self):
+        # the pyarrow and C parsers yield the same data frame
+        for file_name in ["test-taxi-dataset-small.csv", "test-taxi-dataset-profile.csv"]:
+            file_path = os.path.join("tests/resources", file_name)
+            data_frames = [pd.read_csv(file_path, sep=",", encoding="latin1", engine=engine, dtype=_CSV_DTYPES)
+                           for engine in ["pyarrow", "c"]]
+            pd.testing.assert_frame_equal(*data_frames)
+
+    def test_create_from_csv_missing_values(self):
+        # a file with missing values is loaded, and only the nullable identifiers are read with fixed types
+        data_frame = read_csv("tests/resources/test-taxi-dataset-small.csv")
+        data_frame['TAXI_ID'] = data_frame['TAXI_ID'].astype('Int64')
+        data_frame.loc[0, ['TRIP_ID', 'TAXI_ID', 'ORIGIN_STAND']] = None
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "test-taxi-dataset-missing-values.csv")
+            data_frame.to_csv(file_path, index=False)
+            dataset = TaxiServiceTrajectoryDataset.create_from_csv(file_path, max_allowed_speed_kmh=120)
+            expected_data_frame = pd.read_csv(file_path, sep=",", encoding="latin1", engine="c")
+        self.assertEqual(len(expected_data_frame) - 1, len(dataset))
+        for column, dtype in expected_data_frame.dtypes.items():
+            self.assertEqual(_CSV_DTYPES.get(column, dtype), dataset.data_frame[column].dtype)
+
     def test_create_from_csv_within_time_range(self):
         path = "tests/resources/test-taxi-dataset-small.csv"
         start_date = '2013-07-01'
@@ -67,28 +156,32 @@ class TestTaxiServiceTrajectoryDataset(unittest.TestCase):
 
     def test_max_speed(self):
         file_path = "tests/resources/test-taxi-dataset.csv"
-        data_frame = pd.read_csv(file_path, sep=",", encoding="latin1")
         max_allowed_speed_kmh = 30
-        dataset = TaxiServiceTrajectoryDataset(data_frame, scale=True, max_allowed_speed_kmh=max_allowed_speed_kmh)
+        dataset = load_dataset(file_path, scale=True, max_allowed_speed_kmh=max_allowed_speed_kmh)
         time_between_route_points = dataset.time_between_route_points
-        for idx, row in dataset.data_frame.iterrows():
-            route = Route(row['route'])
-            self.assertLessEqual(route.max_speed(time_between_route_points), max_allowed_speed_kmh)
+        # the speeds between consecutive points of the remaining routes, calculated independently of the dataset
+        speeds_kmh = [get_distance(point_a, point_b) / time_between_route_points.total_seconds() * 3.6
+                      for route in dataset.data_frame['route'] for point_a, point_b in zip(route, route[1:])]
+        self.assertLessEqual(max(speeds_kmh), max_allowed_speed_kmh)
 
-        max_allowed_speed_kmh = None
-        data_frame = pd.read_csv(file_path, sep=",", encoding="latin1")
-        dataset = TaxiServiceTrajectoryDataset(data_frame, scale=True, max_allowed_speed_kmh=max_allowed_speed_kmh)
+        # without a speed limit, no route is dropped
+        dataset = load_dataset(file_path, scale=True)
         self.assertEqual(320, len(dataset))
 
+        # the maximum speed of a plain list of points equals that of the route
+        route = dataset.data_frame['route'].iloc[0]
+        self.assertEqual(TaxiServiceTrajectoryDataset.max_speed(route, time_between_route_points),
+                         TaxiServiceTrajectoryDataset.max_speed(list(route), time_between_route_points))
+
     def test_error_cleaning(self):
         # Rows with empty 'Polyline' are dropped
         file_path = "tests/resources/test-taxi-dataset-big.csv"
-        data_frame = pd.read_csv(file_path, sep=",", encoding="latin1")
+        data_frame = read_csv(file_path)
         dataset = TaxiServiceTrajectoryDataset(data_frame, scale=True)
         self.assertEqual(4984, len(dataset))
 
         # Rows where 'Missing_data' is true are dropped
         file_path = "tests/resources/test-taxi-dataset-missing-data.csv"
-        data_frame = pd.read_csv(file_path, sep=",", encoding="latin1")
+        data_frame = read_csv(file_path)
         dataset = TaxiServiceTrajectoryDataset(data_frame, scale=True, max_allowed_speed_kmh=99999)
         self.assertEqual(98, len(dataset))
@@ -10,32 +10,33 @@ from geodata.geodata.route import Route
 class TestHelper(unittest.TestCase):
     def test_get_digits(self):
         value = 0.123456789
-        self.assertEqual(0, get_digits(value, 0))
-        self.assertEqual(1, get_digits(value, 1))
-        self.assertEqual(12345, get_digits(value, 5))
-        self.assertEqual(123456789, get_digits(value, 9))
-        self.assertEqual(1234567890, get_digits(value, 10))
+        for number_of_decimals, digits in [(0, 0), (1, 1), (5, 12345), (9, 123456789), (10, 1234567890)]:
+            with self.subTest(number_of_decimals=number_of_decimals):
+                self.assertEqual(digits, get_digits(value, number_of_decimals))
 
     def test_route_str_to_list(self):
         for route_list in [
             [[-8.58, 41.14], [-8.5, 41.1]],
             []
         ]:
-            self.assertEqual(route_list, parser.route_str_to_list(str(route_list)))
+            with self.subTest(route_list=route_list):
+                self.assertEqual(route_list, parser.route_str_to_list(str(route_list)))
 
     def test_timestamps_str_to_list(self):
         for timestamps_list in [
             [pd.Timestamp('2020-01-01 10:00:00'), pd.Timestamp('2020-01-02 15:00:00')],
             []
         ]:
-            self.assertEqual(timestamps_list, parser.timestamps_str_to_list(str(timestamps_list)))
+            with self.subTest(timestamps_list=timestamps_list):
+                self.assertEqual(timestamps_list, parser.timestamps_str_to_list(str(timestamps_list)))
 
     def test_float_str_to_list(self):
         for float_list in [
             [1, 2.5, 0, 7],
             []
         ]:
-            self.assertEqual(float_list, parser.float_str_to_list(str(float_list)))
+            with self.subTest(float_list=float_list):
+                self.assertEqual(float_list, parser.float_str_to_list(str(float_list)))
 
     def test_routes_str_to_list(self):
         route_degrees = Route([[-8.58, 41.14], [-8.5, 41.1]], coordinates_unit='degrees')
@@ -45,7 +46,8 @@ class TestHelper(unittest.TestCase):
             [route_radians, route_radians],
             []
         ]:
-            self.assertEqual(routes_list, parser.routes_str_to_list(str(routes_list)))
+            with self.subTest(routes_list=routes_list):
+                self.assertEqual(routes_list, parser.routes_str_to_list(str(routes_list)))
 
         route_list = [route_degrees, route_degrees]
         route_str = str(route_list)
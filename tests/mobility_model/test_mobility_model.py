@@ -1,39 +1,64 @@
-import os
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
 import pandas as pd
-from geopy.geocoders import Nominatim
 
 from geodata.mobility_model import mobility_model
 from geodata.geodatasets.taxi import TaxiServiceTrajectoryDataset as Td
 from geodata.helper import parser
 
+# openstreetmap segment ids of the route points in the test file by latitude and longitude rounded to 5 decimals
+OSM_IDS = {
+    (41.15299, -8.61004): 1,
+    (41.15292, -8.61001): 1,
+    (41.1525, -8.61004): 1,
+    (41.15032, -8.61188): 2,
+    (41.15208, -8.61206): 3,
+    (41.15278, -8.6148): 4,
+}
+
+
+class NominatimStub:
+    """
+    Answers the reverse geocoding requests for the route points in the test file without querying Nominatim.
+    """
+
+    def reverse(self, query):
+        latitude, longitude = query
+        return SimpleNamespace(raw={'osm_id': OSM_IDS[(round(latitude, 5), round(longitude, 5))]})
+
+
+def get_directions_for_route_stub(route, ors_path, ors_scheme, ors_profile):
+    """
+    Returns a fixed distance and duration for any route without querying Openrouteservice.
+    """
+    return [{'distance': 100.0, 'duration': 10.0}]
+
 
 # todo: test all mobility model methods, when ors and nominatim are available from GitLab
 class TestHelper(unittest.TestCase):
-    def setUp(self) -> None:
-        self.path_to_model_db = 'tests/mobility_model/test-taxi-model.db'
-        try:
-            os.remove(self.path_to_model_db)
-        except Exception:
-            pass
+    @classmethod
+    def setUpClass(cls) -> None:
+        # the model is calculated once and shared by all tests, which only read from it
+        # keep the model database in memory, so that no database file needs to be written and removed
+        cls.path_to_model_db = ':memory:'
         scheme = 'http'
         ors_path = '172.17.2.117:50003'
         ors_profile = 'driving-car'
-        nominatim_path = '172.17.2.117:50002'
-        nominatim = Nominatim(scheme=scheme, domain=nominatim_path)
+        # answer Nominatim and Openrouteservice requests locally, so that the test does not depend on the network
+        nominatim = NominatimStub()
 
         # create model
         path_to_porto_taxi_file = 'tests/resources/test-taxi-dataset-profile.csv'
-        self.model = mobility_model.MobilityModel(self.path_to_model_db, nominatim, ors_path, scheme, ors_profile)
+        cls.model = mobility_model.MobilityModel(cls.path_to_model_db, nominatim, ors_path, scheme, ors_profile)
         taxi_dataset = Td.create_from_csv(path_to_porto_taxi_file, max_allowed_speed_kmh=120)
-        self.model.calculate_mobility_model(taxi_dataset.data_frame)
+        with mock.patch.object(mobility_model, 'get_directions_for_route', get_directions_for_route_stub):
+            cls.model.calculate_mobility_model(taxi_dataset.data_frame)
 
-    def tearDown(self) -> None:
-        try:
-            os.remove(self.path_to_model_db)
-        except Exception:
-            pass
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.model.db.close()
 
     def test_mobility_model(self):
         # expected: 5 transitions and 4 locations in mobility model